@@ -0,0 +1,262 @@
+"""
+Benchmark of the solvers in missionaries_and_cannibals.py.
+
+Runs every solver mode over a grid of problem sizes, boat capacities and crossing limits, and
+records the wall time, the number of expanded nodes and the peak memory of each run. The random
+strategy is run with fixed seeds, so the runs are repeatable. The results can be saved as a JSON
+baseline and later runs can be compared against it to catch regressions.
+
+EXAMPLE USAGE:
+    python benchmark.py --save baseline.json
+    python benchmark.py --baseline baseline.json
+"""
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+
+from missionaries_and_cannibals import (SOLVED, INFEASIBLE, STRATEGIES, SearchBudget, SearchStats, State,
+                                        findBidirectionalCrossing, findExactCrossing, findOptimalCrossing,
+                                        getCrossingTable, solveSafeCrossing)
+
+# Solver modes that can be benchmarked, the strategies of solveSafeCrossing come first
+MODES = STRATEGIES + ("astar", "bidirectional", "table", "layered")
+
+# Default grid of the benchmark
+DEFAULT_SIZES = ["3x3", "6x6", "10x10", "20x20", "50x50"]
+DEFAULT_CAPACITIES = [2, 3, 5]
+DEFAULT_SLACKS = [0, 2]
+
+
+def runSolver(mode: str, numC: int, numM: int, boatCapacity: int, numCrossings: int, seed: int,
+              budget: SearchBudget) -> dict:
+    """
+    Runs one solver mode on one problem and measures it.
+
+    Tracing the allocations slows the solvers down several times, hence the time is measured in a
+    run without tracing and the peak memory in a second, traced run of the same solver.
+
+    INPUTS:
+        mode: str -> One of MODES
+        numC: int -> Number of cannibals
+        numM: int -> Number of missionaries
+        boatCapacity: int -> The capacity of the boat
+        numCrossings: int -> The number of crossings of the solution (used by the modes that target an exact length)
+        seed: int -> Seed of the random strategy
+        budget: SearchBudget -> Limits of the search for the strategies of solveSafeCrossing
+    OUTPUTS:
+        DICTIONARY OF THE MEASUREMENTS
+    """
+    startTime = time.perf_counter()
+    status, crossings, nodesExpanded = runMode(mode, numC, numM, boatCapacity, numCrossings, seed, budget)
+    elapsedSeconds = time.perf_counter() - startTime
+
+    tracemalloc.start()
+    runMode(mode, numC, numM, boatCapacity, numCrossings, seed, budget)
+    peakMemory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return {
+        "id": "%s/%dx%d/cap%d/k%d" % (mode, numC, numM, boatCapacity, numCrossings),
+        "mode": mode,
+        "numC": numC,
+        "numM": numM,
+        "boatCapacity": boatCapacity,
+        "numCrossings": numCrossings,
+        "seed": seed,
+        "status": status,
+        "crossings": crossings,
+        "seconds": elapsedSeconds,
+        "nodesExpanded": nodesExpanded,
+        "peakMemory": peakMemory,
+    }
+
+
+def runMode(mode: str, numC: int, numM: int, boatCapacity: int, numCrossings: int, seed: int,
+            budget: SearchBudget) -> tuple:
+    """
+    Runs one solver mode on one problem.
+
+    INPUTS:
+        mode: str -> One of MODES
+        numC: int -> Number of cannibals
+        numM: int -> Number of missionaries
+        boatCapacity: int -> The capacity of the boat
+        numCrossings: int -> The number of crossings of the solution (used by the modes that target an exact length)
+        seed: int -> Seed of the random strategy
+        budget: SearchBudget -> Limits of the search for the strategies of solveSafeCrossing
+    OUTPUTS:
+        (STATUS, NUMBER OF CROSSINGS OR NONE, NUMBER OF EXPANDED NODES OR NONE) TUPLE
+    """
+    initialState = State(numC, numM, "west", 0, 0)
+    goalState = State(0, 0, "east", numC, numM)
+
+    if mode in STRATEGIES:
+        stats = SearchStats()
+        result = solveSafeCrossing(initialState, goalState, boatCapacity, numCrossings, mode, seed, budget, stats)
+        crossings = result.path.getLength() - 1 if result.path is not None else None
+        return result.status, crossings, stats.nodesExpanded
+
+    if mode == "astar":
+        path = findOptimalCrossing(initialState, goalState, boatCapacity)
+    elif mode == "bidirectional":
+        path = findBidirectionalCrossing(initialState, goalState, boatCapacity)
+    elif mode == "table":
+        # The sweep is measured too, hence the cached table is not used
+        getCrossingTable.cache_clear()
+        path = getCrossingTable(numC, numM, boatCapacity).getPath(initialState)
+    else:
+        path = findExactCrossing(initialState, goalState, boatCapacity, numCrossings)
+    status = SOLVED if path.getLength() != 0 else INFEASIBLE
+    crossings = path.getLength() - 1 if path.getLength() != 0 else None
+    return status, crossings, None
+
+
+def runBenchmark(modes: list, sizes: list, capacities: list, slacks: list, seed: int, repeat: int,
+                 budget: SearchBudget, output=sys.stdout) -> list:
+    """
+    Runs the benchmark over the whole grid.
+
+    The crossing limits are given as slacks over the minimum number of crossings of each problem,
+    since the minimum changes with the size and the capacity. Problems that have no solution are
+    run once with a limit of 1 crossing. Each run is repeated and the fastest one is kept.
+
+    INPUTS:
+        modes: list -> Solver modes to be run
+        sizes: list -> (numC, numM) pairs
+        capacities: list -> Boat capacities
+        slacks: list -> Extra crossings over the minimum number of crossings
+        seed: int -> Seed of the random strategy
+        repeat: int -> Number of runs of each measurement
+        budget: SearchBudget -> Limits of each search
+        output: file = sys.stdout (default) -> Stream to write the progress to
+    OUTPUTS:
+        LIST OF THE MEASUREMENT DICTIONARIES
+    """
+    results = []
+    for numC, numM in sizes:
+        for boatCapacity in capacities:
+            table = getCrossingTable(numC, numM, boatCapacity)
+            minimumCrossings = table.getDistance(State(numC, numM, "west", 0, 0))
+            if minimumCrossings == -1:
+                limits = [1]
+            else:
+                limits = sorted({minimumCrossings + slack for slack in slacks})
+
+            for numCrossings in limits:
+                for mode in modes:
+                    runs = [runSolver(mode, numC, numM, boatCapacity, numCrossings, seed, budget)
+                            for _ in range(repeat)]
+                    result = min(runs, key=lambda run: run["seconds"])
+                    results.append(result)
+                    output.write("%-36s %-17s %10.6fs %10s nodes %12d bytes\n" % (
+                        result["id"], result["status"], result["seconds"],
+                        result["nodesExpanded"] if result["nodesExpanded"] is not None else "-",
+                        result["peakMemory"]))
+    return results
+
+
+def compareWithBaseline(results: list, baseline: list, tolerance: float, output=sys.stdout) -> int:
+    """
+    Compares the results with a baseline and reports the regressions.
+
+    A run regresses if its status changed, if it expanded more nodes, or if it took more than
+    (1 + tolerance) times the time or the memory of the baseline.
+
+    INPUTS:
+        results: list -> Measurements of the current run
+        baseline: list -> Measurements of the baseline
+        tolerance: float -> Allowed relative increase of time and memory
+        output: file = sys.stdout (default) -> Stream to write the report to
+    OUTPUTS:
+        NUMBER OF REGRESSIONS
+    """
+    baselineById = {result["id"]: result for result in baseline}
+    regressions = 0
+
+    for result in results:
+        old = baselineById.get(result["id"])
+        if old is None:
+            continue
+
+        reasons = []
+        if result["status"] != old["status"]:
+            reasons.append("status %s -> %s" % (old["status"], result["status"]))
+        if result["nodesExpanded"] is not None and old["nodesExpanded"] is not None and \
+                result["nodesExpanded"] > old["nodesExpanded"]:
+            reasons.append("nodes %d -> %d" % (old["nodesExpanded"], result["nodesExpanded"]))
+        if result["seconds"] > old["seconds"] * (1 + tolerance):
+            reasons.append("time %.6fs -> %.6fs" % (old["seconds"], result["seconds"]))
+        if result["peakMemory"] > old["peakMemory"] * (1 + tolerance):
+            reasons.append("memory %d -> %d bytes" % (old["peakMemory"], result["peakMemory"]))
+
+        if reasons:
+            regressions += 1
+            output.write("REGRESSION %s: %s\n" % (result["id"], ", ".join(reasons)))
+
+    output.write("%d regressions in %d runs\n" % (regressions, len(results)))
+    return regressions
+
+
+def parseSize(text: str) -> tuple:
+    """
+    Parses a problem size given as CxM, for example 6x6
+
+    INPUTS:
+        text: str -> Size text
+    OUTPUTS:
+        (NUMBER OF CANNIBALS, NUMBER OF MISSIONARIES) PAIR
+    """
+    numC, separator, numM = text.lower().partition("x")
+    if not separator:
+        raise argparse.ArgumentTypeError("size must be given as CxM, for example 6x6")
+    return int(numC), int(numM)
+
+
+def main(arguments: list = None) -> int:
+    """
+    Entry point of the benchmark.
+
+    INPUTS:
+        arguments: list = None (default) -> Command line arguments, sys.argv if None
+    OUTPUTS:
+        EXIT CODE OF THE PROCESS
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the missionaries and cannibals solvers.")
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES), help="solver modes to run")
+    parser.add_argument("--sizes", nargs="+", type=parseSize, default=[parseSize(size) for size in DEFAULT_SIZES],
+                        help="problem sizes as CxM")
+    parser.add_argument("--capacities", nargs="+", type=int, default=DEFAULT_CAPACITIES, help="boat capacities")
+    parser.add_argument("--slacks", nargs="+", type=int, default=DEFAULT_SLACKS,
+                        help="crossing limits as extra crossings over the minimum")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the random strategy")
+    parser.add_argument("--repeat", type=int, default=3, help="runs of each measurement, the fastest is kept")
+    parser.add_argument("--max-seconds", type=float, default=10.0, help="time budget of each search")
+    parser.add_argument("--max-nodes", type=int, default=None, help="node budget of each search")
+    parser.add_argument("--save", metavar="FILE", help="write the results as a JSON baseline")
+    parser.add_argument("--baseline", metavar="FILE", help="compare the results with a JSON baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed relative increase of time and memory over the baseline")
+    options = parser.parse_args(arguments)
+
+    budget = SearchBudget(maxNodes=options.max_nodes, maxSeconds=options.max_seconds)
+    results = runBenchmark(options.modes, options.sizes, options.capacities, options.slacks,
+                           options.seed, options.repeat, budget)
+
+    if options.save:
+        with open(options.save, "w") as baselineFile:
+            json.dump({"python": sys.version.split()[0], "results": results}, baselineFile, indent=2)
+
+    if options.baseline:
+        with open(options.baseline) as baselineFile:
+            baseline = json.load(baselineFile)["results"]
+        if compareWithBaseline(results, baseline, options.tolerance) > 0:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
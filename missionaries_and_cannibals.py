@@ -6,16 +6,54 @@ any casualties and without exceeding 7 crossings, our purpose is to show how the
 """
 
 import random
-import copy
+import functools
+import heapq
+import math
+import sys
+import time
+import itertools
+from array import array
+from collections import deque
 
 # Set DEBUG to True if you want to see the steps to
 DEBUG = False
 
+@functools.lru_cache(maxsize=None)
+def getBoatLoads(boatCapacity: int) -> tuple:
+    """
+    Precomputes the boat loads that are legal for the given capacity.
+
+    A load is a (cannibals, missionaries) pair with at least one and at most boatCapacity people,
+    in which the missionaries are not outnumbered by the cannibals on the boat. The table is
+    computed once per capacity and ordered by cannibal count, then missionary count.
+
+    INPUTS:
+        boatCapacity: int -> Number of people the boat can carry in one pass
+    OUTPUTS:
+        TUPLE OF (CANNIBALS, MISSIONARIES) PAIRS
+    """
+    loads = []
+    for cannibals in range(boatCapacity + 1):
+        for missionaries in range(boatCapacity - cannibals + 1):
+            if cannibals + missionaries == 0:
+                continue
+            # Missionaries on the boat can not be outnumbered
+            if missionaries > 0 and cannibals > missionaries:
+                continue
+            loads.append((cannibals, missionaries))
+    return tuple(loads)
+
+
 class State:
     '''
     Saves the number of missionaries and cannibals according to current state, for each side and where the boat is located.
+
+    States are immutable value objects: they are hashable on (cannibalsOnWest, missionariesOnWest, boatSide),
+    so they can be stored in sets and used as dictionary keys for constant time duplicate detection.
     '''
 
+    __slots__ = ("boatSide", "cannibalsOnWest", "cannibalsOnEast", "missionariesOnWest", "missionariesOnEast", "hashValue")
+
     def __init__(self, numCannibalsOnWest: int, numMissionariesOnWest: int, botPosition: str, numCannibalsOnEast: int, numMissionariesOnEast: int) -> None:
         """
          Constructor of State class.
@@ -30,20 +68,102 @@ class State:
             SELF OBJECT (<type State>)
          """
 
+        # Attributes are assigned through object.__setattr__ since State objects are immutable
+        setAttribute = object.__setattr__
+
         # Where the boat is currently at {0: West, 1: East}
-        self.boatSide = botPosition
+        setAttribute(self, "boatSide", botPosition)
 
         # Cannibal count on the West side
-        self.cannibalsOnWest = numCannibalsOnWest
+        setAttribute(self, "cannibalsOnWest", numCannibalsOnWest)
 
         # Cannibal count on the East side
-        self.cannibalsOnEast = numCannibalsOnEast
+        setAttribute(self, "cannibalsOnEast", numCannibalsOnEast)
 
         # Missionary count on the West side
-        self.missionariesOnWest = numMissionariesOnWest
+        setAttribute(self, "missionariesOnWest", numMissionariesOnWest)
 
         # Missionary count on the East side
-        self.missionariesOnEast = numMissionariesOnEast
+        setAttribute(self, "missionariesOnEast", numMissionariesOnEast)
+
+        # Hash is computed once, east counts are implied by the west counts for a given problem
+        setAttribute(self, "hashValue", hash((numCannibalsOnWest, numMissionariesOnWest, botPosition)))
+
+    def __setattr__(self, name, value):
+        """
+        Private method to prevent modification of a State after it is constructed.
+
+        INPUTS:
+          name: str -> Name of the attribute to be set
+          value: any -> Value to be assigned
+        OUTPUTS:
+          RAISES AttributeError SINCE STATE OBJECTS ARE IMMUTABLE
+        """
+
+        raise AttributeError("State objects are immutable")
+
+    def __delattr__(self, name):
+        """
+        Private method to prevent deletion of the attributes of a State.
+
+        INPUTS:
+          name: str -> Name of the attribute to be deleted
+        OUTPUTS:
+          RAISES AttributeError SINCE STATE OBJECTS ARE IMMUTABLE
+        """
+
+        raise AttributeError("State objects are immutable")
+
+    def __reduce__(self):
+        """
+        Private method used by pickle and copy modules to rebuild the State through its constructor.
+
+        INPUTS:
+          NONE
+        OUTPUTS:
+          TUPLE OF THE CLASS AND THE CONSTRUCTOR ARGUMENTS
+        """
+
+        return (State, (self.cannibalsOnWest, self.missionariesOnWest, self.boatSide,
+                        self.cannibalsOnEast, self.missionariesOnEast))
+
+    def __copy__(self):
+        """
+        Private method to copy the State. Since states are immutable, the object itself is returned.
+
+        INPUTS:
+          NONE
+        OUTPUTS:
+          SELF OBJECT (<type State>)
+        """
+
+        return self
+
+    def __deepcopy__(self, memo):
+        """
+        Private method to deep copy the State. Since states are immutable, the object itself is returned.
+
+        INPUTS:
+          memo: dict -> Memo dictionary of the copy module
+        OUTPUTS:
+          SELF OBJECT (<type State>)
+        """
+
+        return self
+
+    def __hash__(self):
+        """
+        Private method to override 'hash' method of the State class.
+
+        The hash is derived from the same attributes compared in __eq__, hence equal states have equal hashes.
+
+        INPUTS:
+          NONE
+        OUTPUTS:
+          HASH VALUE OF THE STATE
+        """
+
+        return self.hashValue
 
     def __eq__(self, s):
         """
@@ -64,39 +184,66 @@ class State:
         return isinstance(s, State) and (self.boatSide == s.boatSide) and (
             self.cannibalsOnWest == s.cannibalsOnWest) and (self.missionariesOnWest == s.missionariesOnWest)
 
-    def printCurrentState(self) -> None:
+    def __repr__(self) -> str:
         """
-        Method to print current state of the object.
-        First prints cannibals then missionaries.
+        Private method to override 'repr' method of the State class.
 
         INPUTS:
           NONE
         OUTPUTS:
-          NONE
+          STRING REPRESENTATION OF THE STATE
+        """
 
-        EXAMPLE OUTPUT:
-        CC      C
-        M       MM
+        return "State(%d, %d, %r, %d, %d)" % (self.cannibalsOnWest, self.missionariesOnWest, self.boatSide,
+                                             self.cannibalsOnEast, self.missionariesOnEast)
+
+    def formatState(self) -> str:
+        """
+        Method to format current state of the object as the text printed by printCurrentState.
+        First formats cannibals then missionaries.
+
+        INPUTS:
+          NONE
+        OUTPUTS:
+          TEXT OF THE STATE, ENDING WITH A BLANK LINE
         """
 
-        messageLine = ""
+        parts = []
         # Looks if cannibals on West greater than 0, adds C for each cannibal on the West side
         if self.cannibalsOnWest > 0:
-            messageLine += self.cannibalsOnWest * "C"
+            parts.append(self.cannibalsOnWest * "C")
 
         # Looks if cannibals on East greater than 0, adds C for each cannibal on the East side
         if self.cannibalsOnEast > 0:
-            messageLine += "\t\t" + self.cannibalsOnEast * "C"
+            parts.append("\t\t" + self.cannibalsOnEast * "C")
 
         # Looks if missionaries on West greater than 0, adds M for each missionary on the West side in a new line
         if self.missionariesOnWest >= 0:
-            messageLine += "\n" + self.missionariesOnWest * "M"
+            parts.append("\n" + self.missionariesOnWest * "M")
 
         # Looks if missionaries on East greater than 0, adds M for each missionary on the East side
         if self.missionariesOnEast > 0:
-            messageLine += "\t\t" + self.missionariesOnEast * "M"
+            parts.append("\t\t" + self.missionariesOnEast * "M")
+
+        parts.append("\n\n")
+        return "".join(parts)
+
+    def printCurrentState(self) -> None:
+        """
+        Method to print current state of the object.
+        First prints cannibals then missionaries.
+
+        INPUTS:
+          NONE
+        OUTPUTS:
+          NONE
+
+        EXAMPLE OUTPUT:
+        CC      C
+        M       MM
+        """
 
-        print(messageLine + "\n")
+        sys.stdout.write(self.formatState())
 
     def isStateSafe(self) -> bool:
         """
@@ -128,7 +275,8 @@ class State:
 
         As cannibal count can not exceed the missionary count, then 
         this condition is also be checked for people on the boat. Function 
-        checks that constraint is achieved for the given case.
+        checks that constraint is achieved for the given case. The same
+        rule is applied by generateExpansions through getBoatLoads.
 
         INPUTS:
           nextState: State -> State object that holds the information about the boat when crossed
@@ -138,9 +286,9 @@ class State:
 
         # Calculate number of missionaries and cannibals on the boat during crosing
         cannibalCountOnBoat = abs(
-            nextState.cannibalsOnWest - self.cannibalsOnEast)
+            nextState.cannibalsOnWest - self.cannibalsOnWest)
         missionaryCountOnBoat = abs(
-            nextState.missionariesOnWest - self.missionariesOnEast)
+            nextState.missionariesOnWest - self.missionariesOnWest)
 
         # Check if missionaries are endangered
         if missionaryCountOnBoat > 0:
@@ -152,7 +300,8 @@ class State:
         """
 
         Method to generate possible crosses of the boat according to the capacity of the boat.
-        *****
+        The boat loads are taken from the precomputed table of getBoatLoads, hence the work
+        per state depends on the capacity of the boat instead of the number of people.
 
         INPUTS:
           boatCapacity: int -> NUMBER OF PEOPLE CAN THE BOAT CARRY IN ONE PASS
@@ -164,34 +313,30 @@ class State:
         expansions = []  # List to hold generated neighbors for the given state
 
         if self.boatSide == "east":  # if the boat is on the East side
-            # For each cannibal n gram
-            for i in (range(self.cannibalsOnEast + 1)):
-                # Create n grams of missionaries
-                for j in (range(self.missionariesOnEast + 1)):
-                    # That do not exceed boat capacity
-                    if 0 < (i + j) and (i + j) <= boatCapacity:
-                        # And create a new state with the generated n grams.
-                        expansionToAdd = State(self.cannibalsOnWest + i, self.missionariesOnWest + j,
-                                               "west", self.cannibalsOnEast - i, self.missionariesOnEast - j)
-                        # If new state is safe and crossing is possible
-                        if expansionToAdd.isStateSafe() and self.isActionSafe(expansionToAdd):
-                            # Add the neighbor
-                            expansions.append(expansionToAdd)
+            # For each legal boat load of cannibals and missionaries
+            for i, j in getBoatLoads(boatCapacity):
+                # That can be taken from the East side
+                if i <= self.cannibalsOnEast and j <= self.missionariesOnEast:
+                    # And create a new state with the boat load.
+                    expansionToAdd = State(self.cannibalsOnWest + i, self.missionariesOnWest + j,
+                                           "west", self.cannibalsOnEast - i, self.missionariesOnEast - j)
+                    # If new state is safe (the boat load is already safe)
+                    if expansionToAdd.isStateSafe():
+                        # Add the neighbor
+                        expansions.append(expansionToAdd)
         # Or in the west side
         else:
-            # For each cannibal n gram
-            for i in (range(self.cannibalsOnWest + 1)):
-                # Create n grams of missionaries
-                for j in (range(self.missionariesOnWest + 1)):
-                    # That do not exceed boat capacity
-                    if 0 < (i + j) and (i + j) <= boatCapacity:
-                        # And create a new state with the generated n grams.
-                        expansionToAdd = State(self.cannibalsOnWest - i, self.missionariesOnWest - j,
-                                               "east", self.cannibalsOnEast + i, self.missionariesOnEast + j)
-                        # If new state is safe and crossing is possible
-                        if expansionToAdd.isStateSafe() and self.isActionSafe(expansionToAdd):
-                            # Add the neighbor
-                            expansions.append(expansionToAdd)
+            # For each legal boat load of cannibals and missionaries
+            for i, j in getBoatLoads(boatCapacity):
+                # That can be taken from the West side
+                if i <= self.cannibalsOnWest and j <= self.missionariesOnWest:
+                    # And create a new state with the boat load.
+                    expansionToAdd = State(self.cannibalsOnWest - i, self.missionariesOnWest - j,
+                                           "east", self.cannibalsOnEast + i, self.missionariesOnEast + j)
+                    # If new state is safe (the boat load is already safe)
+                    if expansionToAdd.isStateSafe():
+                        # Add the neighbor
+                        expansions.append(expansionToAdd)
         # Return generated neighbors
         return expansions
 
@@ -206,11 +351,62 @@ class State:
          THE STRING THAT CONTAINS THE BOAT ACTION IN MANNER OF TYPE OF PASSENGERS AND THEIR COUNTS
         """
         if direction == 1:
-            return "SEND " + str(self.cannibalsOnEast - prevState.cannibalsOnEast) + " CANNIBALS " + str(
-                self.missionariesOnEast - prevState.missionariesOnEast) + " MISSIONARIES"
+            return "SEND %d CANNIBALS %d MISSIONARIES" % (self.cannibalsOnEast - prevState.cannibalsOnEast,
+                                                          self.missionariesOnEast - prevState.missionariesOnEast)
         else:
-            return "RETURN " + str(self.cannibalsOnWest - prevState.cannibalsOnWest) + " CANNIBALS " + str(
-                self.missionariesOnWest - prevState.missionariesOnWest) + " MISSIONARIES"
+            return "RETURN %d CANNIBALS %d MISSIONARIES" % (self.cannibalsOnWest - prevState.cannibalsOnWest,
+                                                            self.missionariesOnWest - prevState.missionariesOnWest)
+
+
+def expandStateBatch(cannibalsOnWest, missionariesOnWest, boatSides, numCannibals: int, numMissionaries: int,
+                     boatCapacity: int) -> tuple:
+    """
+    Generates the neighbors of a whole batch of states at once with NumPy, for example an entire
+    layer of a breadth first search.
+
+    States are given as parallel integer arrays. Boat sides are encoded as 0 for west and 1 for east.
+    Every legal boat load of getBoatLoads is applied to every state, and the loads that take more
+    people than there are on the side of the boat or leave missionaries outnumbered on either bank
+    are masked out.
+
+    INPUTS:
+        cannibalsOnWest: array -> Cannibal counts on the West side of each state
+        missionariesOnWest: array -> Missionary counts on the West side of each state
+        boatSides: array -> Side of the boat of each state {0: West, 1: East}
+        numCannibals: int -> Total number of cannibals
+        numMissionaries: int -> Total number of missionaries
+        boatCapacity: int -> Number of people the boat can carry in one pass
+    OUTPUTS:
+        TUPLE OF ARRAYS (CANNIBALS ON WEST, MISSIONARIES ON WEST, BOAT SIDES, PARENT INDICES) OF THE NEIGHBORS
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError("expandStateBatch requires NumPy, install it with 'pip install numpy'") from None
+
+    cannibalsOnWest = np.asarray(cannibalsOnWest, dtype=np.int64)
+    missionariesOnWest = np.asarray(missionariesOnWest, dtype=np.int64)
+    boatSides = np.asarray(boatSides, dtype=np.int64)
+
+    loads = np.array(getBoatLoads(boatCapacity), dtype=np.int64).reshape(-1, 2)
+
+    # People leave the West side when the boat is on the West side and arrive otherwise
+    direction = np.where(boatSides == 0, -1, 1)[:, None]
+    newCannibalsOnWest = cannibalsOnWest[:, None] + direction * loads[None, :, 0]
+    newMissionariesOnWest = missionariesOnWest[:, None] + direction * loads[None, :, 1]
+    newCannibalsOnEast = numCannibals - newCannibalsOnWest
+    newMissionariesOnEast = numMissionaries - newMissionariesOnWest
+
+    # The boat load has to be available on the side of the boat
+    mask = ((newCannibalsOnWest >= 0) & (newCannibalsOnEast >= 0) &
+            (newMissionariesOnWest >= 0) & (newMissionariesOnEast >= 0))
+    # Missionaries can not be outnumbered on either side
+    mask &= (newMissionariesOnWest == 0) | (newMissionariesOnWest >= newCannibalsOnWest)
+    mask &= (newMissionariesOnEast == 0) | (newMissionariesOnEast >= newCannibalsOnEast)
+
+    parentIndices, loadIndices = np.nonzero(mask)
+    return (newCannibalsOnWest[parentIndices, loadIndices], newMissionariesOnWest[parentIndices, loadIndices],
+            1 - boatSides[parentIndices], parentIndices)
 
 
 class Debug:
@@ -294,13 +490,15 @@ class Debug:
             NONE
         """
         if self.debug:
-            print("\n---GENERATED NEIGHBORS---")
+            # Assemble the whole message and write it at once
+            parts = ["\n---GENERATED NEIGHBORS---\n"]
             if len(expansions) == 0:
-                print("No neighbors generated for this state...")
+                parts.append("No neighbors generated for this state...\n")
             else:
                 for i, neighbor in enumerate(expansions):
-                    print("***NEIGHBOR #", i, "***")
-                    neighbor.printCurrentState()
+                    parts.append("***NEIGHBOR # %d ***\n" % i)
+                    parts.append(neighbor.formatState())
+            sys.stdout.write("".join(parts))
 
 
 class Path:
@@ -308,16 +506,19 @@ class Path:
     Path class holds a list of all possible paths and  adds new states into path.
     """
 
-    def __init__(self, lst: list = []) -> None:
+    def __init__(self, lst: list = None) -> None:
         """
         Constructor of the Path class.
 
         INPUTS:
-            lst: list = [] (default) -> Initial list object to hold generated path from a node
+            lst: list = None (default) -> Initial list object to hold generated path from a node
         OUTPUTS:
             SELF OBJECT (<type Path>) 
         """
-        self.states = lst
+        self.states = lst if lst is not None else []
+
+        # Set of the states in the path for constant time membership checks
+        self.stateSet = set(self.states)
 
     def contains(self, state: State) -> bool:
         """
@@ -329,7 +530,7 @@ class Path:
             TRUE IF STATE ALREADY EXISTS
             FALSE OTHERWISE
         """
-        if state in self.states:
+        if state in self.stateSet:
             return True
         return False
 
@@ -356,6 +557,7 @@ class Path:
         """
         if not self.contains(state):
             self.states.append(state)
+            self.stateSet.add(state)
             return True
         return False
 
@@ -381,135 +583,2574 @@ class Path:
         """
         return self.states
 
-    def printCurrentPath(self) -> None:
+    def renderCurrentPath(self) -> str:
         """
-        Prints the current path saved in the object
+        Renders the current path saved in the object as the text printed by printCurrentPath.
+        The text is assembled in a list and joined once, instead of printing each state and action.
 
         INPUTS:
             NONE
+        OUTPUTS:
+            TEXT OF THE CURRENT PATH
+        """
+
+        # If list is empty
+        if self.getLength() == 0:
+            return "The path is empty\n"
+
+        # Render the state of the first element
+        parts = [self.states[0].formatState()]
+
+        # For the rest of the states
+        for index in range(1, len(self.states)):
+            # Get current and previous states for rendering the actions between states
+            state = self.states[index]
+            prevState = self.states[index - 1]
+
+            # If boat is on the west side of the river the boat is sent, otherwise it returns
+            parts.append(state.getAction(prevState, 1 if index % 2 == 1 else 0))
+            parts.append("\n")
+
+            # Render the contents of the selected state in the interation
+            parts.append(state.formatState())
+
+        return "".join(parts)
+
+    def printCurrentPath(self, stream=None) -> None:
+        """
+        Prints the current path saved in the object with a single write
+
+        INPUTS:
+            stream: file = None (default) -> Stream to write the path to, the standard output if None
         OUTPUTS:
             DISPLAYS THE CURRENT PATH IF THE PATH IS NOT EMPTY 
         """
 
-        # If not empty
-        if self.getLength() != 0:
-            # Print the state of the first element
-            self.states[0].printCurrentState()
+        (stream if stream is not None else sys.stdout).write(self.renderCurrentPath())
+
 
-            # For the rest of the states
-            for index in range(1, len(self.states)):
-                # Get current and previous states for printing the actions between states
-                state = self.states[index]
-                prevState = self.states[index - 1]
+class SearchNode:
+    """
+    SearchNode class represents a path of the search by its terminal state and a pointer to the
+    node of the previous state. Paths that are generated from the same node share their prefix,
+    hence creating a new path is O(1) instead of copying the whole list of states. A SearchNode
+    is converted into a Path object only when it is returned as a solution.
+    """
 
-                # If boat is on the west side of the river
-                if index % 2 == 1:
-                    print(state.getAction(prevState, 1))
-                # If boat is on the east side of the river
-                else:
-                    print(state.getAction(prevState, 0))
+    __slots__ = ("state", "parent", "depth")
 
-                # Print the contents of the selected state in the interation
-                state.printCurrentState()
-        # If list is empty
-        else:
-            print("The path is empty")
+    def __init__(self, state: State, parent=None) -> None:
+        """
+        Constructor of the SearchNode class.
+
+        INPUTS:
+            state: State -> Terminal state of the path
+            parent: SearchNode = None (default) -> Node of the previous state, None for the starting state
+        OUTPUTS:
+            SELF OBJECT (<type SearchNode>)
+        """
+        self.state = state
+        self.parent = parent
+
+        # Number of crossings from the starting state
+        self.depth = 0 if parent is None else parent.depth + 1
+
+    def getLength(self) -> int:
+        """
+        Gets the length of the path that ends with this node
+
+        INPUTS:
+            NONE
+        OUTPUTS:
+            NUMBER OF STATES IN THE PATH (INCLUDING STARTING STATE)
+        """
+        return self.depth + 1
+
+    def contains(self, state: State) -> bool:
+        """
+        Checks whether the given State has already exists in the path or not by following the parent pointers
+
+        INPUTS:
+            state:  State -> The state object to be checked for
+        OUTPUTS:
+            TRUE IF STATE ALREADY EXISTS
+            FALSE OTHERWISE
+        """
+        node = self
+        while node is not None:
+            if node.state == state:
+                return True
+            node = node.parent
+        return False
+
+    def toPath(self) -> Path:
+        """
+        Converts the node into a Path object by following the parent pointers
+
+        INPUTS:
+            NONE
+        OUTPUTS:
+            PATH OBJECT THAT HOLDS THE STATES FROM THE STARTING STATE TO THIS NODE
+        """
+        states = []
+        node = self
+        while node is not None:
+            states.append(node.state)
+            node = node.parent
+        states.reverse()
+        return Path(states)
 
 
-def findSafeCrossing(initialState: State, goalState: State, boatCapacity: int, numCrossings: int) -> Path:
+def estimateRemainingCrossings(state: State, boatCapacity: int) -> int:
     """
-    Applies a non-deterministic search algorithm for a given initial state from the parameters and checks if the possible solutions that reaches to a goal state that given 
-    from the parameters. 
+    Calculates a lower bound for the number of crossings needed to carry everyone on the west side
+    of the river to the east side.
 
-    The function contains a queue object in order to keep track of the possible paths.
-    Until the queue length reaches to zero, in each iteration, the first element, which
-    is a Path itself is selected from the queue and will be removed. If the terminal
-    state of the selected Path is equal to goal state, then the algorithm has found the
-    solution and returns the path found. However, if it is not equal to the goal state,
-    then the possible neighbors of the terminal are generated and new paths will be added
-    to the queue in random positions. This randomness is the main cause for the non- deterministic search.
+    Every crossing from west to east carries at most boatCapacity people, and every round trip
+    (west to east and back) has to bring at least one person back with the boat. Therefore a round
+    trip moves at most boatCapacity - 1 people to the east side, while the last crossing moves
+    boatCapacity people. If the boat is on the east side, it has to return with at least one person first.
 
-    Additionally, while adding the paths that generated with the neighbors of the state
-    selected, hence we are adding neighbors to a Path object, the add method of the Path
-    object itself looks if there are any instance of the same State has already been inserted
-    or not. This is the way that the function prevents looping.
+    INPUTS:
+        state: State -> The state to be estimated
+        boatCapacity: int -> The capacity of the boat
+    OUTPUTS:
+        LOWER BOUND FOR THE REMAINING CROSSINGS (math.inf IF THE STATE CAN NOT REACH THE GOAL)
+    """
+    peopleOnWest = state.cannibalsOnWest + state.missionariesOnWest
+    if peopleOnWest == 0:
+        return 0
 
-    In order to find a solution with a path length of 7, the algorithm tries to find as
-    many solutions as possible and selects the first one that has a length of 7 crossings.
-    If any solutions found that more than length 7 and if the DEBUG mode of the script is
-    enabled, this function will print the solution, but continues until the desired amount 
-    crossings with expected solution is found.
+    crossings = 0
+    # The boat has to come back to the west side with at least one person
+    if state.boatSide == "east":
+        crossings = 1
+        peopleOnWest += 1
+
+    if peopleOnWest <= boatCapacity:
+        return crossings + 1
+    if boatCapacity < 2:
+        # Nobody can bring the boat back without undoing the crossing
+        return math.inf
+
+    # Round trips that leave boatCapacity - 1 people on the east side, followed by the last crossing
+    roundTrips = -(-(peopleOnWest - boatCapacity) // (boatCapacity - 1))
+    return crossings + 2 * roundTrips + 1
+
+
+def estimateEqualGroupCrossings(state: State, boatCapacity: int) -> int:
+    """
+    Calculates a lower bound for the number of crossings needed to carry everyone to the east side
+    when the number of cannibals and missionaries are equal, which is much closer to the real
+    number than estimateRemainingCrossings for such problems.
+
+    With equal groups, a state in which both banks have missionaries is safe only if each bank has
+    as many cannibals as missionaries. While the missionaries are split, a crossing to the east
+    carries at most boatCapacity // 2 pairs and the boat has to bring at least one pair back, so a
+    round trip moves at most boatCapacity // 2 - 1 pairs. The bound follows the best case of this
+    relaxation: the missionaries leave the west side with the first crossing that splits them (at
+    most boatCapacity missionaries, if enough cannibals have been carried over before), they cross
+    as pairs, and the last of them leave together with the cannibals that fit in the boat, after
+    which the remaining cannibals need estimateRemainingCrossings crossings. Going back to the state
+    where all the missionaries are on the west side is accounted for as well. With a boat for fewer
+    than four people only a few pairs can be carried at all, and 0 is returned.
 
     INPUTS:
-        initialState: State -> Initial node parameter given as a start point
-        goalState: State -> Final node to be reached for
-        boatCapacity: int -> The capacity of the board
-        numCrossings: int -> The number of maximum crossings
+        state: State -> The state to be estimated, with as many cannibals as missionaries in total
+        boatCapacity: int -> The capacity of the boat
     OUTPUTS:
-        SOLUTION PATH IF FOUND ANY
+        LOWER BOUND FOR THE REMAINING CROSSINGS
+    """
+    numPairs = state.missionariesOnWest + state.missionariesOnEast
+    missionaries = state.missionariesOnWest
+    if missionaries == 0 or boatCapacity < 4:
+        return 0
+    pairsPerCrossing = boatCapacity // 2
+    # Pairs moved to the east side by a round trip while the missionaries are split
+    netPairs = pairsPerCrossing - 1
+
+    def getCannibalCrossings(cannibals: int) -> int:
+        # Crossings for the cannibals left on the west side once every missionary is on the east side
+        return estimateRemainingCrossings(State(cannibals, 0, "east", numPairs - cannibals, numPairs), boatCapacity)
+
+    def fromWestSplit(pairs: int) -> int:
+        # Boat on the west side with the given pairs on the west side
+        best = math.inf
+        roundTrips = 0
+        if pairs > boatCapacity:
+            roundTrips = -(-(pairs - boatCapacity) // netPairs)
+            pairs -= roundTrips * netPairs
+        # The last missionaries leave with at least 2 * pairs - boatCapacity cannibals left behind
+        while pairs >= 1:
+            best = min(best, 2 * roundTrips + 1 + getCannibalCrossings(max(0, 2 * pairs - boatCapacity)))
+            if pairs - pairsPerCrossing < 1:
+                break
+            roundTrips += 1
+            pairs -= netPairs
+        return best
+
+    def fromEastSplit(pairs: int) -> int:
+        # Boat on the east side with the given pairs on the west side
+        return 1 + fromWestSplit(pairs + 1) if pairs + 1 < numPairs else 1
+
+    def fromWestAll(cannibalsOnEast: int) -> int:
+        # Boat and every missionary on the west side, a round trip of cannibals may come first
+        best = math.inf
+        for roundTrips in range(2):
+            if roundTrips == 1:
+                cannibalsOnEast = max(cannibalsOnEast + boatCapacity - 1, boatCapacity)
+            if numPairs <= boatCapacity:
+                cannibalsLeft = max(0, 2 * numPairs - cannibalsOnEast - boatCapacity)
+                best = min(best, 2 * roundTrips + 1 + getCannibalCrossings(cannibalsLeft))
+            # The first split leaves as many cannibals as missionaries on the east side
+            missionariesMoved = min(boatCapacity, (boatCapacity + cannibalsOnEast) // 2, numPairs - 1)
+            if missionariesMoved >= 1:
+                best = min(best, 2 * roundTrips + 1 + fromEastSplit(numPairs - missionariesMoved))
+        return best
+
+    def getReturnCrossings(pairs: int) -> int:
+        # Boat on the east side, bringing every missionary back to the west side first
+        climbs = max(0, -(-(numPairs - boatCapacity - pairs) // netPairs))
+        return 2 * climbs + 1 + fromWestAll(boatCapacity)
+
+    if missionaries == numPairs:
+        crossings = fromWestAll(state.cannibalsOnEast)
+        return crossings if state.boatSide == "west" else crossings + 1
+    if state.boatSide == "west":
+        crossings = fromWestSplit(missionaries)
+        if missionaries > 1:
+            crossings = min(crossings, 1 + getReturnCrossings(missionaries - 1))
+        return crossings
+    return min(fromEastSplit(missionaries), getReturnCrossings(missionaries))
+
+
+class FifoFrontier:
+    """
+    Frontier that returns the nodes in insertion order, which results in a breadth first search.
     """
-    pathToReachGoal = Path()
 
-    queue = []
-    queue.append(Path([initialState]))
-    counter = 0
+    def __init__(self) -> None:
+        """
+        Constructor of the FifoFrontier class.
 
-    debugger = Debug(DEBUG)
+        INPUTS:
+            NONE
+        OUTPUTS:
+            SELF OBJECT (<type FifoFrontier>)
+        """
+        self.nodes = deque()
 
-    while len(queue) != 0:  # While queue is not empty
+    def __len__(self) -> int:
+        return len(self.nodes)
 
-        if counter == 10000:
-            print("\nNo solution found in 10000 iterations, probably the solution is impossible to reach, exiting....\n")
-            exit(1)
+    def push(self, node: SearchNode) -> None:
+        """
+        Adds a node to the end of the frontier in O(1)
 
-        counter += 1  # Increment step for showing iteration count
+        INPUTS:
+            node: SearchNode -> The node to be added
+        OUTPUTS:
+            NONE
+        """
+        self.nodes.append(node)
 
-        # Get the path in the front of the queue and delete it from the queue
-        currentPath = queue[0]
-        queue.remove(currentPath)
+    def pop(self) -> SearchNode:
+        """
+        Removes and returns the oldest node of the frontier in O(1)
 
-        # Get the state in the last visited part in the current path
-        currentState = currentPath.getTerminalState()
+        INPUTS:
+            NONE
+        OUTPUTS:
+            THE OLDEST NODE IN THE FRONTIER
+        """
+        return self.nodes.popleft()
 
-        # If debugger is enabled, then print a fancy starting message
-        debugger.printStartMessage(counter, currentState)
 
-        # If the goal state reached with the selected terminal
-        if currentState == goalState:
-            # And if the Path length is numCrossings (numCrossings + 1 INCLUDING STARTING STATE)
-            if (currentPath.getLength() == numCrossings + 1):
-                # Assign the return value
-                pathToReachGoal = currentPath
-                # Print a fancy ending message if debugger is enabled
-                debugger.printFinishMessage(
-                    counter, currentPath.getLength())
-                break
-            else:
-                # Else, found another solution with different length,
-                # print a fancy warning message.
-                debugger.printErrorFinishMessage(currentPath.getLength())
+class LifoFrontier:
+    """
+    Frontier that returns the most recently added node first, which results in a depth first search.
+    """
 
-        # Extend the terminal node
-        expansions = currentState.generateExpansions(boatCapacity)
+    def __init__(self) -> None:
+        """
+        Constructor of the LifoFrontier class.
 
-        # Print the expansions of the terminal node
-        debugger.printExpansionsMessage(expansions)
+        INPUTS:
+            NONE
+        OUTPUTS:
+            SELF OBJECT (<type LifoFrontier>)
+        """
+        self.nodes = []
 
-        # Create new paths and add them to the random places in the queue
-        for expansion in expansions:
-            # Deep copy the Path in order to make changes permanent
-            pathToAdd = copy.deepcopy(currentPath)
-            # If new neighbor to add does not creates a loop
-            if pathToAdd.add(expansion):
-                # Add the path to a random place in the queue
-                randomIndex = random.randint(0, len(queue))
-                queue.insert(randomIndex, pathToAdd)
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def push(self, node: SearchNode) -> None:
+        """
+        Adds a node to the top of the stack in O(1)
 
-    return pathToReachGoal
+        INPUTS:
+            node: SearchNode -> The node to be added
+        OUTPUTS:
+            NONE
+        """
+        self.nodes.append(node)
 
+    def pop(self) -> SearchNode:
+        """
+        Removes and returns the most recently added node in O(1)
+
+        INPUTS:
+            NONE
+        OUTPUTS:
+            THE NEWEST NODE IN THE FRONTIER
+        """
+        return self.nodes.pop()
+
+
+class RandomFrontier:
+    """
+    Frontier that returns a uniformly random node, which keeps the search non-deterministic.
+
+    Instead of inserting the node to a random position of a list and removing the first element,
+    which are O(n) operations, a random node is swapped with the last one and popped in O(1).
+    """
+
+    def __init__(self, seed: int = None) -> None:
+        """
+        Constructor of the RandomFrontier class.
+
+        INPUTS:
+            seed: int = None (default) -> Seed of the random number generator, None for a random seed
+        OUTPUTS:
+            SELF OBJECT (<type RandomFrontier>)
+        """
+        self.nodes = []
+        self.random = random.Random(seed)
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def push(self, node: SearchNode) -> None:
+        """
+        Adds a node to the frontier in O(1)
+
+        INPUTS:
+            node: SearchNode -> The node to be added
+        OUTPUTS:
+            NONE
+        """
+        self.nodes.append(node)
+
+    def pop(self) -> SearchNode:
+        """
+        Removes and returns a random node of the frontier in O(1)
+
+        INPUTS:
+            NONE
+        OUTPUTS:
+            A RANDOMLY SELECTED NODE IN THE FRONTIER
+        """
+        nodes = self.nodes
+        randomIndex = self.random.randrange(len(nodes))
+        nodes[randomIndex], nodes[-1] = nodes[-1], nodes[randomIndex]
+        return nodes.pop()
+
+
+class PriorityFrontier:
+    """
+    Frontier backed by a binary heap that returns the node with the lowest priority first.
+    Nodes with equal priorities are returned in insertion order.
+    """
+
+    def __init__(self, priority) -> None:
+        """
+        Constructor of the PriorityFrontier class.
+
+        INPUTS:
+            priority: function -> Function that takes a SearchNode and returns its priority
+        OUTPUTS:
+            SELF OBJECT (<type PriorityFrontier>)
+        """
+        self.heap = []
+        self.priority = priority
+        self.counter = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+    def push(self, node: SearchNode) -> None:
+        """
+        Adds a node to the heap in O(log n)
+
+        INPUTS:
+            node: SearchNode -> The node to be added
+        OUTPUTS:
+            NONE
+        """
+        heapq.heappush(self.heap, (self.priority(node), next(self.counter), node))
+
+    def pop(self) -> SearchNode:
+        """
+        Removes and returns the node with the lowest priority in O(log n)
+
+        INPUTS:
+            NONE
+        OUTPUTS:
+            THE NODE WITH THE LOWEST PRIORITY IN THE FRONTIER
+        """
+        return heapq.heappop(self.heap)[2]
+
+
+# Search strategies that can be selected for findSafeCrossing
+STRATEGIES = ("random", "bfs", "dfs", "best")
+
+
+def createFrontier(strategy: str, boatCapacity: int, seed: int = None):
+    """
+    Creates the frontier that implements the given search strategy.
+
+    INPUTS:
+        strategy: str -> One of "random", "bfs", "dfs" or "best"
+        boatCapacity: int -> The capacity of the boat, used by the heuristic of best first search
+        seed: int = None (default) -> Seed of the random strategy
+    OUTPUTS:
+        FRONTIER OBJECT WITH push AND pop METHODS
+    """
+    if strategy == "random":
+        return RandomFrontier(seed)
+    if strategy == "bfs":
+        return FifoFrontier()
+    if strategy == "dfs":
+        return LifoFrontier()
+    if strategy == "best":
+        return PriorityFrontier(lambda node: estimateRemainingCrossings(node.state, boatCapacity))
+    raise ValueError("Unknown search strategy '%s', expected one of %s" % (strategy, ", ".join(STRATEGIES)))
+
+
+# Statuses of a SearchResult
+SOLVED = "solved"
+INFEASIBLE = "infeasible"
+BUDGET_EXHAUSTED = "budget exhausted"
+
+# Number of iterations between the checks of the time and memory budgets
+BUDGET_CHECK_INTERVAL = 64
+
+
+class SearchBudget:
+    """
+    SearchBudget holds the limits of a search. A limit that is None is not checked.
+    """
+
+    __slots__ = ("maxNodes", "maxSeconds", "maxMemory")
+
+    def __init__(self, maxNodes: int = None, maxSeconds: float = None, maxMemory: int = None) -> None:
+        """
+        Constructor of the SearchBudget class.
+
+        INPUTS:
+            maxNodes: int = None (default) -> Maximum number of nodes to be expanded
+            maxSeconds: float = None (default) -> Maximum wall-clock time of the search in seconds
+            maxMemory: int = None (default) -> Maximum estimated memory of the queue and the visited set in bytes
+        OUTPUTS:
+            SELF OBJECT (<type SearchBudget>)
+        """
+        self.maxNodes = maxNodes
+        self.maxSeconds = maxSeconds
+        self.maxMemory = maxMemory
+
+
+class SearchResult:
+    """
+    SearchResult holds the outcome of a search: the solution path (None if not found), the status
+    of the search, the best partial progress and the cost of the search.
+    """
+
+    __slots__ = ("path", "status", "bestPath", "nodesExpanded", "elapsedSeconds", "seed")
+
+    def __init__(self, path: Path, status: str, bestPath: Path, nodesExpanded: int, elapsedSeconds: float,
+                 seed: int = None) -> None:
+        """
+        Constructor of the SearchResult class.
+
+        INPUTS:
+            path: Path -> Solution path, None if no solution is found
+            status: str -> One of SOLVED, INFEASIBLE or BUDGET_EXHAUSTED
+            bestPath: Path -> Solution path if solved, otherwise the path to the state closest to the goal state
+            nodesExpanded: int -> Number of nodes expanded by the search
+            elapsedSeconds: float -> Wall-clock time of the search in seconds
+            seed: int = None (default) -> Seed of the random strategy that produced the result, if known
+        OUTPUTS:
+            SELF OBJECT (<type SearchResult>)
+        """
+        self.path = path
+        self.status = status
+        self.bestPath = bestPath
+        self.nodesExpanded = nodesExpanded
+        self.elapsedSeconds = elapsedSeconds
+        self.seed = seed
+
+    def isSolved(self) -> bool:
+        """
+        Checks whether the search found a solution
+
+        INPUTS:
+            NONE
+        OUTPUTS:
+            TRUE IF THE STATUS IS SOLVED ELSE FALSE
+        """
+        return self.status == SOLVED
+
+    def toDict(self) -> dict:
+        """
+        Converts the result into a dictionary that can be serialized as JSON.
+        States are written as [cannibals on west, missionaries on west, boat side] lists.
+
+        INPUTS:
+            NONE
+        OUTPUTS:
+            DICTIONARY OF THE RESULT
+        """
+        def encodePath(path: Path) -> list:
+            if path is None:
+                return None
+            return [[state.cannibalsOnWest, state.missionariesOnWest, state.boatSide] for state in path.getContent()]
+
+        return {
+            "status": self.status,
+            "crossings": self.path.getLength() - 1 if self.path is not None else None,
+            "path": encodePath(self.path),
+            "bestPath": encodePath(self.bestPath),
+            "nodesExpanded": self.nodesExpanded,
+            "elapsedSeconds": self.elapsedSeconds,
+            "seed": self.seed,
+        }
+
+
+class SearchStats:
+    """
+    SearchStats holds the counters and the timings of a search. It is filled by solveSafeCrossing
+    when the search ends and can be exported as JSON.
+    """
+
+    __slots__ = ("nodesExpanded", "nodesGenerated", "duplicateHits", "peakFrontierSize",
+                 "expansionSeconds", "frontierSeconds", "totalSeconds")
+
+    def __init__(self) -> None:
+        """
+        Constructor of the SearchStats class.
+
+        INPUTS:
+            NONE
+        OUTPUTS:
+            SELF OBJECT (<type SearchStats>)
+        """
+        # Number of nodes taken from the queue
+        self.nodesExpanded = 0
+        # Number of nodes added to the queue
+        self.nodesGenerated = 0
+        # Number of neighbors skipped since they create a loop or were already reached with the same number of crossings
+        self.duplicateHits = 0
+        # Maximum number of nodes in the queue
+        self.peakFrontierSize = 0
+        # Time spent in generateExpansions
+        self.expansionSeconds = 0.0
+        # Time spent in the push and pop operations of the queue
+        self.frontierSeconds = 0.0
+        # Wall-clock time of the whole search
+        self.totalSeconds = 0.0
+
+    def toDict(self) -> dict:
+        """
+        Converts the statistics into a dictionary
+
+        INPUTS:
+            NONE
+        OUTPUTS:
+            DICTIONARY OF THE STATISTICS
+        """
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def toJson(self) -> str:
+        """
+        Converts the statistics into a JSON string
+
+        INPUTS:
+            NONE
+        OUTPUTS:
+            JSON STRING OF THE STATISTICS
+        """
+        import json
+        return json.dumps(self.toDict())
+
+
+class SearchHooks:
+    """
+    SearchHooks holds the optional callbacks that solveSafeCrossing calls on the events of the search.
+    A callback that is None is not called, hence costs nothing.
+    """
+
+    __slots__ = ("onExpand", "onGenerate", "onDuplicate", "onSolution")
+
+    def __init__(self, onExpand=None, onGenerate=None, onDuplicate=None, onSolution=None) -> None:
+        """
+        Constructor of the SearchHooks class.
+
+        INPUTS:
+            onExpand: function = None (default) -> Called with the SearchNode taken from the queue
+            onGenerate: function = None (default) -> Called with the SearchNode added to the queue
+            onDuplicate: function = None (default) -> Called with the skipped State and the length of the path it extends
+            onSolution: function = None (default) -> Called with the solution Path
+        OUTPUTS:
+            SELF OBJECT (<type SearchHooks>)
+        """
+        self.onExpand = onExpand
+        self.onGenerate = onGenerate
+        self.onDuplicate = onDuplicate
+        self.onSolution = onSolution
+
+
+class JsonlTraceSink:
+    """
+    JsonlTraceSink writes the events of a search to a file as JSON lines, for example
+    {"event": "expand", "depth": 3, "state": [4, 4, "west"]}. The lines are collected in a buffer
+    and written in batches, so a full trace of a large search can be recorded incrementally
+    without a write per event. Its hooks are passed to solveSafeCrossing through getHooks.
+    """
+
+    def __init__(self, target, bufferEvents: int = 4096) -> None:
+        """
+        Constructor of the JsonlTraceSink class.
+
+        INPUTS:
+            target: str or file -> Path of the trace file, or a text stream to write to
+            bufferEvents: int = 4096 (default) -> Number of events collected before a write
+        OUTPUTS:
+            SELF OBJECT (<type JsonlTraceSink>)
+        """
+        if isinstance(target, str):
+            self.stream = open(target, "w")
+            self.ownsStream = True
+        else:
+            self.stream = target
+            self.ownsStream = False
+        self.bufferEvents = bufferEvents
+        self.buffer = []
+        self.eventCount = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, excValue, traceback) -> None:
+        self.close()
+
+    def record(self, event: str, depth: int, state: State) -> None:
+        """
+        Adds an event to the buffer and writes the buffer if it is full
+
+        INPUTS:
+            event: str -> Name of the event
+            depth: int -> Number of crossings of the path of the event
+            state: State -> State of the event
+        OUTPUTS:
+            NONE
+        """
+        self.buffer.append('{"event": "%s", "depth": %d, "state": [%d, %d, "%s"]}\n' % (
+            event, depth, state.cannibalsOnWest, state.missionariesOnWest, state.boatSide))
+        self.eventCount += 1
+        if len(self.buffer) >= self.bufferEvents:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Writes the buffered events to the stream
+
+        INPUTS:
+            NONE
+        OUTPUTS:
+            NONE
+        """
+        if self.buffer:
+            self.stream.write("".join(self.buffer))
+            self.buffer.clear()
+        self.stream.flush()
+
+    def close(self) -> None:
+        """
+        Writes the buffered events and closes the stream if the sink has opened it
+
+        INPUTS:
+            NONE
+        OUTPUTS:
+            NONE
+        """
+        self.flush()
+        if self.ownsStream:
+            self.stream.close()
+
+    def getHooks(self) -> SearchHooks:
+        """
+        Creates the hooks that record the events of a search into the sink
+
+        INPUTS:
+            NONE
+        OUTPUTS:
+            SEARCHHOOKS OBJECT
+        """
+        record = self.record
+        return SearchHooks(
+            onExpand=lambda node: record("expand", node.depth, node.state),
+            onGenerate=lambda node: record("generate", node.depth, node.state),
+            onDuplicate=lambda state, length: record("duplicate", length, state),
+            onSolution=lambda path: record("solution", path.getLength() - 1, path.getTerminalState()))
+
+
+def findSafeCrossing(initialState: State, goalState: State, boatCapacity: int, numCrossings: int,
+                     strategy: str = "random", seed: int = None, allowRevisits: bool = False) -> Path:
+    """
+    Applies a non-deterministic search algorithm for a given initial state from the parameters and checks if the possible solutions that reaches to a goal state that given 
+    from the parameters. 
+
+    The function contains a queue object in order to keep track of the possible paths.
+    Until the queue length reaches to zero, in each iteration, the first element, which
+    is a SearchNode that represents a path through its parent pointers, is selected from
+    the queue and will be removed. If the terminal state of the selected path is equal to goal state, then the algorithm has found the
+    solution and returns the path found. However, if it is not equal to the goal state,
+    then the possible neighbors of the terminal are generated and new paths will be added
+    to the queue in random positions. This randomness is the main cause for the non- deterministic search.
+
+    The order of the queue is selected with the strategy parameter: "random" (default) selects a
+    random path in each iteration, "bfs" selects the oldest path, "dfs" selects the newest path and
+    "best" selects the path whose terminal state is estimated to be the closest to the goal state.
+    The random strategy can be made reproducible by giving a seed.
+
+    Additionally, while adding the paths that generated with the neighbors of the state
+    selected, the contains method of the SearchNode looks if there are any instance of the
+    same State has already been inserted to the path or not. This is the way that the function
+    prevents looping. Paths longer than numCrossings are never expanded, and a path ends as soon
+    as it reaches the goal state.
+
+    If allowRevisits is True, a plan may visit the same state more than once, for example by
+    carrying the same people back and forth. The loop check is then replaced by a visited set keyed
+    by (state, path length), which guarantees that the same state is never expanded twice at the
+    same depth across different paths. Since the continuations of such a path depend only on its
+    terminal state and its length, the visited set never hides a solution.
+
+    In order to find a solution with a path length of 7, the algorithm tries to find as
+    many solutions as possible and selects the first one that has a length of 7 crossings.
+    If any solutions found that more than length 7 and if the DEBUG mode of the script is
+    enabled, this function will print the solution, but continues until the desired amount 
+    crossings with expected solution is found.
+
+    The search gives up after 10000 iterations. Use solveSafeCrossing to set other budgets and
+    to get the status of the search along with the best partial progress.
+
+    INPUTS:
+        initialState: State -> Initial node parameter given as a start point
+        goalState: State -> Final node to be reached for
+        boatCapacity: int -> The capacity of the board
+        numCrossings: int -> The number of maximum crossings
+        strategy: str = "random" (default) -> Search strategy, one of "random", "bfs", "dfs" or "best"
+        seed: int = None (default) -> Seed for the random strategy
+        allowRevisits: bool = False (default) -> Accept plans that visit the same state more than once
+    OUTPUTS:
+        SOLUTION PATH IF FOUND ANY, EMPTY PATH OTHERWISE
+    """
+    result = solveSafeCrossing(initialState, goalState, boatCapacity, numCrossings, strategy, seed,
+                               SearchBudget(maxNodes=10000), allowRevisits=allowRevisits)
+
+    if result.status == BUDGET_EXHAUSTED:
+        print("\nNo solution found in 10000 iterations, probably the solution is impossible to reach....\n")
+
+    return result.path if result.path is not None else Path()
+
+
+def solveSafeCrossing(initialState: State, goalState: State, boatCapacity: int, numCrossings: int,
+                      strategy: str = "random", seed: int = None, budget: "SearchBudget" = None,
+                      stats: "SearchStats" = None, hooks: "SearchHooks" = None,
+                      allowRevisits: bool = False) -> "SearchResult":
+    """
+    Applies the search of findSafeCrossing within the given budget and returns a SearchResult
+    instead of a bare Path, so the search can be bounded and run inside a long-lived process.
+
+    The status of the result is SOLVED if a path with exactly numCrossings crossings is found,
+    INFEASIBLE if every path up to numCrossings crossings (or, with allowRevisits, every state at
+    every depth it can reach) has been tried without finding one, which proves that there is no
+    such path, and BUDGET_EXHAUSTED
+    if a budget ran out first. In the last two cases the best path of the result is the path to
+    the state that is estimated to be the closest to the goal state. Instances that
+    isCrossingPossible rejects are reported as INFEASIBLE without any search.
+
+    If a SearchStats object is given, it is filled with the counters and the timings of the search
+    when the search ends. The callbacks of the given SearchHooks object are called for each event.
+    Without them, only a few integer counters are maintained.
+
+    INPUTS:
+        initialState: State -> Initial node parameter given as a start point
+        goalState: State -> Final node to be reached for
+        boatCapacity: int -> The capacity of the boat
+        numCrossings: int -> The number of crossings of the solution
+        strategy: str = "random" (default) -> Search strategy, one of "random", "bfs", "dfs" or "best"
+        seed: int = None (default) -> Seed for the random strategy
+        budget: SearchBudget = None (default) -> Limits of the search, unlimited if None
+        stats: SearchStats = None (default) -> Object to be filled with the statistics of the search
+        hooks: SearchHooks = None (default) -> Callbacks to be called on the events of the search
+        allowRevisits: bool = False (default) -> Accept plans that visit the same state more than once
+    OUTPUTS:
+        SEARCHRESULT OBJECT
+    """
+    startTime = time.perf_counter()
+    if budget is None:
+        budget = SearchBudget()
+
+    # Reject the instances that can not be solved before starting the search
+    if not isCrossingPossible(initialState, goalState, boatCapacity, numCrossings):
+        return SearchResult(None, INFEASIBLE, Path(), 0, time.perf_counter() - startTime)
+
+    queue = createFrontier(strategy, boatCapacity, seed)
+    queue.push(SearchNode(initialState))
+    counter = 0
+
+    # (state, path length) pairs that have already been put into the queue, used only if revisits are allowed
+    visited = {(initialState, 1)} if allowRevisits else set()
+
+    # Node closest to the goal state found so far, as the partial progress of the search
+    bestNode = None
+    bestEstimate = math.inf
+    heuristic = estimateRemainingCrossings if isStandardGoal(goalState) else lambda state, capacity: 0
+
+    # Approximate memory taken by a node in the queue together with its entry in the visited set
+    bytesPerNode = (sys.getsizeof(SearchNode(initialState)) + sys.getsizeof((initialState, 1)) +
+                    sys.getsizeof(initialState) + 4 * 8)
+
+    debugger = Debug(DEBUG)
+
+    # Counters of the search, timings are measured only if statistics are requested
+    generated = 0
+    duplicateHits = 0
+    peakFrontierSize = 1
+    expansionSeconds = 0.0
+    frontierSeconds = 0.0
+    timed = stats is not None
+    clock = time.perf_counter
+
+    # Callbacks are looked up once, None if not requested
+    onExpand = hooks.onExpand if hooks is not None else None
+    onGenerate = hooks.onGenerate if hooks is not None else None
+    onDuplicate = hooks.onDuplicate if hooks is not None else None
+    onSolution = hooks.onSolution if hooks is not None else None
+
+    def createResult(status: str, solutionNode: SearchNode = None) -> SearchResult:
+        if stats is not None:
+            stats.nodesExpanded = counter
+            stats.nodesGenerated = generated
+            stats.duplicateHits = duplicateHits
+            stats.peakFrontierSize = peakFrontierSize
+            stats.expansionSeconds = expansionSeconds
+            stats.frontierSeconds = frontierSeconds
+            stats.totalSeconds = time.perf_counter() - startTime
+        path = solutionNode.toPath() if solutionNode is not None else None
+        if path is not None and onSolution is not None:
+            onSolution(path)
+        bestPath = path if path is not None else (bestNode.toPath() if bestNode is not None else Path())
+        return SearchResult(path, status, bestPath, counter, time.perf_counter() - startTime, seed)
+
+    while len(queue) != 0:  # While queue is not empty
+
+        # Stop if any of the budgets is exhausted, the clock is read only once in a while
+        if budget.maxNodes is not None and counter >= budget.maxNodes:
+            return createResult(BUDGET_EXHAUSTED)
+        if counter % BUDGET_CHECK_INTERVAL == 0:
+            if budget.maxSeconds is not None and time.perf_counter() - startTime >= budget.maxSeconds:
+                return createResult(BUDGET_EXHAUSTED)
+            if budget.maxMemory is not None and (len(queue) + len(visited)) * bytesPerNode >= budget.maxMemory:
+                return createResult(BUDGET_EXHAUSTED)
+
+        counter += 1  # Increment step for showing iteration count
+
+        # Get the next node according to the strategy and delete it from the queue
+        if timed:
+            startClock = clock()
+            currentNode = queue.pop()
+            frontierSeconds += clock() - startClock
+        else:
+            currentNode = queue.pop()
+
+        if onExpand is not None:
+            onExpand(currentNode)
+
+        # Get the state in the last visited part in the current path
+        currentState = currentNode.state
+
+        # Length of the path that ends with the current node (INCLUDING STARTING STATE)
+        currentLength = currentNode.getLength()
+
+        # If debugger is enabled, then print a fancy starting message
+        debugger.printStartMessage(counter, currentState)
+
+        # Keep the node that is estimated to be the closest to the goal state
+        estimate = heuristic(currentState, boatCapacity)
+        if estimate < bestEstimate:
+            bestNode = currentNode
+            bestEstimate = estimate
+
+        # If the goal state reached with the selected terminal
+        if currentState == goalState:
+            # And if the Path length is numCrossings (numCrossings + 1 INCLUDING STARTING STATE)
+            if (currentLength == numCrossings + 1):
+                # Print a fancy ending message if debugger is enabled
+                debugger.printFinishMessage(
+                    counter, currentLength)
+                # Build the Path object only for the solution
+                return createResult(SOLVED, currentNode)
+            else:
+                # Else, found another solution with different length,
+                # print a fancy warning message.
+                debugger.printErrorFinishMessage(currentLength)
+                # A plan ends when it reaches the goal state, hence the node is not extended
+                continue
+
+        # Paths that already have numCrossings crossings can not reach the goal in the desired amount
+        if currentLength > numCrossings:
+            continue
+
+        # Extend the terminal node
+        if timed:
+            startClock = clock()
+            expansions = currentState.generateExpansions(boatCapacity)
+            expansionSeconds += clock() - startClock
+        else:
+            expansions = currentState.generateExpansions(boatCapacity)
+
+        # Print the expansions of the terminal node
+        debugger.printExpansionsMessage(expansions)
+
+        # Create new nodes and add them to the queue
+        for expansion in expansions:
+            if allowRevisits:
+                # Skip the neighbor if it has already been reached with the same number of crossings,
+                # since every continuation of the new node is then a continuation of the earlier one
+                visitKey = (expansion, currentLength + 1)
+                isDuplicate = visitKey in visited
+                visited.add(visitKey)
+            else:
+                # Skip the neighbor if adding it to the path creates a loop
+                isDuplicate = currentNode.contains(expansion)
+            if isDuplicate:
+                duplicateHits += 1
+                if onDuplicate is not None:
+                    onDuplicate(expansion, currentLength)
+                continue
+            # The new node shares the path prefix with the current node through its parent pointer
+            nodeToAdd = SearchNode(expansion, currentNode)
+            # Add the node to the queue
+            if timed:
+                startClock = clock()
+                queue.push(nodeToAdd)
+                frontierSeconds += clock() - startClock
+            else:
+                queue.push(nodeToAdd)
+            generated += 1
+            if onGenerate is not None:
+                onGenerate(nodeToAdd)
+
+        if len(queue) > peakFrontierSize:
+            peakFrontierSize = len(queue)
+
+    # Every path (or every (state, path length) pair) up to numCrossings crossings has been tried
+    return createResult(INFEASIBLE)
+
+
+def isStandardGoal(goalState: State) -> bool:
+    """
+    Checks whether the given goal state is the state where everyone is on the east side of the river.
+    estimateRemainingCrossings is a valid lower bound only for such goal states.
+
+    INPUTS:
+        goalState: State -> Final node to be reached for
+    OUTPUTS:
+        TRUE IF NOBODY IS LEFT ON THE WEST SIDE AND THE BOAT IS ON THE EAST SIDE ELSE FALSE
+    """
+    return goalState.cannibalsOnWest == 0 and goalState.missionariesOnWest == 0 and goalState.boatSide == "east"
+
+
+def isCrossingFeasible(numC: int, numM: int, boatCapacity: int) -> bool:
+    """
+    Decides in O(1) whether numC cannibals and numM missionaries can be carried from the west side
+    to the east side of the river, using the known results for this family of problems:
+
+    - Nobody can cross with an empty boat, and with a capacity of 1 nobody can bring the boat back.
+    - If the cannibals outnumber the missionaries, the missionaries are in danger from the start.
+    - If there are more missionaries than cannibals (or only one kind of people), any boat for two people suffices.
+    - With the same number of both, a boat for two carries at most 3 pairs, a boat for three at most
+      5 pairs and a boat for four or more any number of pairs.
+
+    INPUTS:
+        numC: int -> Number of cannibals
+        numM: int -> Number of missionaries
+        boatCapacity: int -> The capacity of the boat
+    OUTPUTS:
+        TRUE IF THE PROBLEM HAS A SOLUTION ELSE FALSE
+    """
+    if numC < 0 or numM < 0 or numC + numM == 0 or boatCapacity < 1:
+        return False
+    if boatCapacity == 1:
+        return numC + numM == 1
+    if numC > numM > 0:
+        return False
+    if numC != numM:
+        return True
+    if boatCapacity == 2:
+        return numC <= 3
+    if boatCapacity == 3:
+        return numC <= 5
+    return True
+
+
+@functools.lru_cache(maxsize=4096)
+def getMinimumCrossings(numC: int, numM: int, boatCapacity: int) -> int:
+    """
+    Gets the minimum number of crossings to carry numC cannibals and numM missionaries from the
+    west side to the east side of the river.
+
+    Infeasible problems are answered by isCrossingFeasible. If the numbers of cannibals and
+    missionaries differ, the lower bound of estimateRemainingCrossings is known to be reached.
+    Otherwise the answer is computed once with findOptimalCrossing and memoized.
+
+    INPUTS:
+        numC: int -> Number of cannibals
+        numM: int -> Number of missionaries
+        boatCapacity: int -> The capacity of the boat
+    OUTPUTS:
+        MINIMUM NUMBER OF CROSSINGS, -1 IF THE PROBLEM HAS NO SOLUTION
+    """
+    if not isCrossingFeasible(numC, numM, boatCapacity):
+        return -1
+    initialState = State(numC, numM, "west", 0, 0)
+    if numC != numM:
+        return estimateRemainingCrossings(initialState, boatCapacity)
+    return findOptimalCrossing(initialState, State(0, 0, "east", numC, numM), boatCapacity).getLength() - 1
+
+
+def isCrossingPossible(initialState: State, goalState: State, boatCapacity: int, numCrossings: int) -> bool:
+    """
+    Rejects in O(1) the searches that can not find a path with exactly numCrossings crossings.
+
+    The boat changes sides in every crossing, hence the parity of numCrossings is fixed by the
+    sides of the boat in the initial and the goal states. If everyone has to be carried from the
+    west side to the east side, the problem also has to be feasible and numCrossings can not be
+    less than the lower bound of estimateRemainingCrossings.
+
+    INPUTS:
+        initialState: State -> Initial node parameter given as a start point
+        goalState: State -> Final node to be reached for
+        boatCapacity: int -> The capacity of the boat
+        numCrossings: int -> The number of crossings of the solution
+    OUTPUTS:
+        FALSE IF THERE IS CERTAINLY NO SOLUTION, TRUE OTHERWISE
+    """
+    if numCrossings < 0 or numCrossings % 2 != (initialState.boatSide != goalState.boatSide):
+        return False
+
+    isStandardStart = (initialState.boatSide == "west" and initialState.cannibalsOnEast == 0 and
+                       initialState.missionariesOnEast == 0)
+    if isStandardStart and isStandardGoal(goalState):
+        if not isCrossingFeasible(initialState.cannibalsOnWest, initialState.missionariesOnWest, boatCapacity):
+            return False
+        if numCrossings < estimateRemainingCrossings(initialState, boatCapacity):
+            return False
+    return True
+
+
+def findOptimalCrossing(initialState: State, goalState: State, boatCapacity: int) -> Path:
+    """
+    Applies A* search to find a path with the minimum number of crossings from the initial state
+    to the goal state.
+
+    Paths are selected by the number of crossings done so far plus the lower bound on the
+    remaining crossings given by estimateRemainingCrossings. Since the bound never overestimates,
+    the first path that reaches the goal state is a shortest one. Each state is stored once with
+    the fewest crossings it has been reached with, so no state is expanded more than needed.
+
+    INPUTS:
+        initialState: State -> Initial node parameter given as a start point
+        goalState: State -> Final node to be reached for
+        boatCapacity: int -> The capacity of the boat
+    OUTPUTS:
+        SHORTEST SOLUTION PATH IF FOUND ANY, EMPTY PATH OTHERWISE
+    """
+    if isStandardGoal(goalState):
+        heuristic = lambda state: estimateRemainingCrossings(state, boatCapacity)
+    else:
+        # The lower bound is only valid when everyone has to cross, fall back to uniform cost search
+        heuristic = lambda state: 0
+
+    # Number of crossings of the best known path for each state
+    bestCrossings = {initialState: 0}
+    queue = PriorityFrontier(lambda node: node.depth + heuristic(node.state))
+    queue.push(SearchNode(initialState))
+
+    while len(queue) != 0:
+        currentNode = queue.pop()
+        currentState = currentNode.state
+
+        # Skip the node if the state has been reached with fewer crossings after it was queued
+        if currentNode.depth > bestCrossings[currentState]:
+            continue
+
+        if currentState == goalState:
+            return currentNode.toPath()
+
+        for expansion in currentState.generateExpansions(boatCapacity):
+            crossings = currentNode.depth + 1
+            if crossings < bestCrossings.get(expansion, math.inf) and heuristic(expansion) != math.inf:
+                bestCrossings[expansion] = crossings
+                queue.push(SearchNode(expansion, currentNode))
+
+    return Path()
+
+
+def findBidirectionalCrossing(initialState: State, goalState: State, boatCapacity: int) -> Path:
+    """
+    Applies bidirectional breadth first search to find a path with the minimum number of crossings.
+
+    One search starts from the initial state and another one from the goal state. Since every
+    crossing can be undone by carrying the same people back, the neighbors of a state are the same
+    in both directions. In each step the smaller layer is expanded completely, and once the searches
+    meet, the meeting state with the fewest total crossings is used to join the two halves.
+
+    INPUTS:
+        initialState: State -> Initial node parameter given as a start point
+        goalState: State -> Final node to be reached for
+        boatCapacity: int -> The capacity of the boat
+    OUTPUTS:
+        SHORTEST SOLUTION PATH IF FOUND ANY, EMPTY PATH OTHERWISE
+    """
+    # Nobody can be carried into or out of a state where the missionaries are outnumbered
+    if not initialState.isStateSafe() or not goalState.isStateSafe():
+        return Path()
+
+    if initialState == goalState:
+        return Path([initialState])
+
+    # Previous state and the number of crossings for each state reached from both directions
+    forwardParents = {initialState: None}
+    forwardCrossings = {initialState: 0}
+    backwardParents = {goalState: None}
+    backwardCrossings = {goalState: 0}
+
+    forwardLayer = [initialState]
+    backwardLayer = [goalState]
+
+    while forwardLayer and backwardLayer:
+        # Expand the smaller layer
+        if len(forwardLayer) <= len(backwardLayer):
+            layer, parents, crossings, otherCrossings = forwardLayer, forwardParents, forwardCrossings, backwardCrossings
+        else:
+            layer, parents, crossings, otherCrossings = backwardLayer, backwardParents, backwardCrossings, forwardCrossings
+
+        nextLayer = []
+        meetingState = None
+        for state in layer:
+            for expansion in state.generateExpansions(boatCapacity):
+                if expansion in parents:
+                    continue
+                parents[expansion] = state
+                crossings[expansion] = crossings[state] + 1
+                nextLayer.append(expansion)
+                # Keep the meeting state with the fewest total crossings in this layer
+                if expansion in otherCrossings and (meetingState is None or
+                                                    otherCrossings[expansion] < otherCrossings[meetingState]):
+                    meetingState = expansion
+
+        if meetingState is not None:
+            # Join the path from the initial state and the path to the goal state
+            states = []
+            state = meetingState
+            while state is not None:
+                states.append(state)
+                state = forwardParents[state]
+            states.reverse()
+            state = backwardParents[meetingState]
+            while state is not None:
+                states.append(state)
+                state = backwardParents[state]
+            return Path(states)
+
+        if layer is forwardLayer:
+            forwardLayer = nextLayer
+        else:
+            backwardLayer = nextLayer
+
+    return Path()
+
+
+class CrossingTable:
+    """
+    CrossingTable holds the number of crossings to the goal state and the next state towards the
+    goal for every state of a problem, computed by a single breadth first sweep from the goal state.
+
+    States are stored in dense arrays indexed by (boat side, cannibals on west, missionaries on west),
+    hence the table takes 2 * (C + 1) * (M + 1) cells. Since every crossing can be undone, the sweep
+    from the goal state visits exactly the states that can reach it. After the sweep, feasibility and
+    distance queries are O(1) and an optimal Path is read out in O(path length).
+    """
+
+    def __init__(self, numCannibals: int, numMissionaries: int, boatCapacity: int, goalState: State = None) -> None:
+        """
+        Constructor of the CrossingTable class. Runs the sweep from the goal state.
+
+        INPUTS:
+            numCannibals: int -> Total number of cannibals
+            numMissionaries: int -> Total number of missionaries
+            boatCapacity: int -> The capacity of the boat
+            goalState: State = None (default) -> Final node to be reached for, everyone on the east side if None
+        OUTPUTS:
+            SELF OBJECT (<type CrossingTable>)
+        """
+        self.numCannibals = numCannibals
+        self.numMissionaries = numMissionaries
+        self.boatCapacity = boatCapacity
+        if goalState is None:
+            goalState = State(0, 0, "east", numCannibals, numMissionaries)
+        self.goalState = goalState
+
+        size = 2 * (numCannibals + 1) * (numMissionaries + 1)
+        # Crossings to the goal state, -1 for states that can not reach the goal
+        self.distances = array("i", [-1]) * size
+        # Index of the next state on a shortest path to the goal, -1 for the goal and unreachable states
+        self.successors = array("i", [-1]) * size
+
+        self.sweep()
+
+    def getIndex(self, state: State) -> int:
+        """
+        Gets the index of the given state in the arrays of the table
+
+        INPUTS:
+            state: State -> The state to be looked up
+        OUTPUTS:
+            INDEX OF THE STATE
+        """
+        side = 0 if state.boatSide == "west" else 1
+        return (side * (self.numCannibals + 1) + state.cannibalsOnWest) * (self.numMissionaries + 1) + state.missionariesOnWest
+
+    def getState(self, index: int) -> State:
+        """
+        Builds the state stored at the given index of the table
+
+        INPUTS:
+            index: int -> Index of the state
+        OUTPUTS:
+            STATE OBJECT OF THE INDEX
+        """
+        rest, missionariesOnWest = divmod(index, self.numMissionaries + 1)
+        side, cannibalsOnWest = divmod(rest, self.numCannibals + 1)
+        return State(cannibalsOnWest, missionariesOnWest, "west" if side == 0 else "east",
+                     self.numCannibals - cannibalsOnWest, self.numMissionaries - missionariesOnWest)
+
+    def sweep(self) -> None:
+        """
+        Fills the distances and successors by a breadth first search from the goal state.
+        Works on the indices directly instead of creating State objects.
+
+        INPUTS:
+            NONE
+        OUTPUTS:
+            NONE
+        """
+        numCannibals = self.numCannibals
+        numMissionaries = self.numMissionaries
+        rowSize = numMissionaries + 1
+        sideSize = (numCannibals + 1) * rowSize
+        distances = self.distances
+        successors = self.successors
+        loads = getBoatLoads(self.boatCapacity)
+
+        goalIndex = self.getIndex(self.goalState)
+        if not self.goalState.isStateSafe():
+            return
+        distances[goalIndex] = 0
+        layer = [goalIndex]
+        distance = 0
+
+        while layer:
+            distance += 1
+            nextLayer = []
+            for index in layer:
+                side, rest = divmod(index, sideSize)
+                cannibalsOnWest, missionariesOnWest = divmod(rest, rowSize)
+                # People leave the west side if the boat is there and arrive otherwise
+                direction = -1 if side == 0 else 1
+                neighborSideOffset = (1 - side) * sideSize
+                for cannibals, missionaries in loads:
+                    newCannibals = cannibalsOnWest + direction * cannibals
+                    newMissionaries = missionariesOnWest + direction * missionaries
+                    if not (0 <= newCannibals <= numCannibals and 0 <= newMissionaries <= numMissionaries):
+                        continue
+                    # Missionaries can not be outnumbered on either side
+                    if 0 < newMissionaries < newCannibals:
+                        continue
+                    if 0 < numMissionaries - newMissionaries < numCannibals - newCannibals:
+                        continue
+                    neighbor = neighborSideOffset + newCannibals * rowSize + newMissionaries
+                    if distances[neighbor] == -1:
+                        distances[neighbor] = distance
+                        successors[neighbor] = index
+                        nextLayer.append(neighbor)
+            layer = nextLayer
+
+    def getDistance(self, state: State) -> int:
+        """
+        Gets the minimum number of crossings from the given state to the goal state in O(1)
+
+        INPUTS:
+            state: State -> The state to be looked up
+        OUTPUTS:
+            NUMBER OF CROSSINGS, -1 IF THE GOAL CAN NOT BE REACHED
+        """
+        return self.distances[self.getIndex(state)]
+
+    def isSolvable(self, state: State) -> bool:
+        """
+        Checks whether the goal state can be reached from the given state in O(1)
+
+        INPUTS:
+            state: State -> The state to be looked up
+        OUTPUTS:
+            TRUE IF THE GOAL STATE CAN BE REACHED ELSE FALSE
+        """
+        return self.getDistance(state) != -1
+
+    def getPath(self, state: State) -> Path:
+        """
+        Reads out a shortest path from the given state to the goal state by following the successors
+
+        INPUTS:
+            state: State -> The starting state
+        OUTPUTS:
+            SHORTEST SOLUTION PATH IF THE GOAL CAN BE REACHED, EMPTY PATH OTHERWISE
+        """
+        index = self.getIndex(state)
+        if self.distances[index] == -1:
+            return Path()
+        states = [state]
+        index = self.successors[index]
+        while index != -1:
+            states.append(self.getState(index))
+            index = self.successors[index]
+        return Path(states)
+
+
+@functools.lru_cache(maxsize=32)
+def getCrossingTable(numCannibals: int, numMissionaries: int, boatCapacity: int) -> CrossingTable:
+    """
+    Gets the CrossingTable of a problem whose goal is to carry everyone to the east side.
+    Tables of recently used problems are kept in memory, so repeated queries skip the sweep.
+
+    INPUTS:
+        numCannibals: int -> Total number of cannibals
+        numMissionaries: int -> Total number of missionaries
+        boatCapacity: int -> The capacity of the boat
+    OUTPUTS:
+        CROSSINGTABLE OBJECT OF THE PROBLEM
+    """
+    return CrossingTable(numCannibals, numMissionaries, boatCapacity)
+
+
+def findExactCrossing(initialState: State, goalState: State, boatCapacity: int, numCrossings: int,
+                      atMost: bool = False) -> Path:
+    """
+    Decides whether a plan with exactly (or at most) numCrossings crossings exists and builds one,
+    using layered reachability instead of random retries.
+
+    The plans are the ones of findSafeCrossing with allowRevisits: a plan may visit the same state
+    more than once, for example by carrying the same people back and forth, but it ends as soon as
+    it reaches the goal state. Hence this function answers whether such a plan exists, which may
+    differ from the default search of findSafeCrossing that never visits a state twice.
+
+    Layer k holds the states that can be reached with exactly k crossings without passing through
+    the goal state, and it is built from the neighbors of the states of layer k - 1 other than the
+    goal state. Each layer is determined by the previous one, hence once two layers of the same
+    parity are equal the layers repeat with a period of two and the later layers are not computed.
+    The plan is then built backwards from the goal state by selecting a neighbor other than the
+    goal state in the previous layer in each step, preferring the states that are not in the plan yet.
+
+    INPUTS:
+        initialState: State -> Initial node parameter given as a start point
+        goalState: State -> Final node to be reached for
+        boatCapacity: int -> The capacity of the boat
+        numCrossings: int -> The number of crossings of the plan
+        atMost: bool = False (default) -> Accept any plan with at most numCrossings crossings (the shortest one is returned)
+    OUTPUTS:
+        SOLUTION PATH IF THERE IS ANY, EMPTY PATH OTHERWISE
+    """
+    layers = [{initialState}]
+    # Index of the first layer that is equal to the layer two crossings before it
+    stableFrom = None
+
+    def getLayer(crossings: int) -> set:
+        if stableFrom is None or crossings < stableFrom:
+            return layers[crossings]
+        return layers[stableFrom - 2 + (crossings - stableFrom) % 2]
+
+    # Number of crossings of the plan to be built
+    planCrossings = None
+    if initialState == goalState and (atMost or numCrossings == 0):
+        planCrossings = 0
+
+    while planCrossings is None and len(layers) <= numCrossings and stableFrom is None:
+        nextLayer = set()
+        for state in layers[-1]:
+            # A plan ends at the goal state, hence the goal state is not extended
+            if state != goalState:
+                nextLayer.update(state.generateExpansions(boatCapacity))
+        layers.append(nextLayer)
+        crossings = len(layers) - 1
+
+        if crossings >= 2 and nextLayer == layers[-3]:
+            stableFrom = crossings
+        if goalState in nextLayer and (atMost or crossings == numCrossings):
+            planCrossings = crossings
+
+    # The layers are stable, look up the layer of the desired length directly
+    if planCrossings is None and stableFrom is not None and goalState in getLayer(numCrossings):
+        planCrossings = numCrossings
+
+    if planCrossings is None:
+        return Path()
+
+    # Build the plan backwards from the goal state
+    states = [goalState]
+    statesInPlan = {goalState}
+    for crossings in range(planCrossings - 1, -1, -1):
+        layer = getLayer(crossings)
+        previousState = None
+        for expansion in states[-1].generateExpansions(boatCapacity):
+            if expansion in layer and expansion != goalState:
+                previousState = expansion
+                if expansion not in statesInPlan:
+                    break
+        states.append(previousState)
+        statesInPlan.add(previousState)
+    states.reverse()
+    return Path(states)
+
+
+def iterSafeCrossings(initialState: State, goalState: State, boatCapacity: int, maxCrossings: int):
+    """
+    Lazily generates every distinct safe plan with at most maxCrossings crossings, in non-decreasing
+    number of crossings.
+
+    The plans are found by a breadth first search over SearchNode objects, so only the frontier is
+    kept in memory and the paths in it share their prefixes. As in findSafeCrossing, a plan never
+    visits the same state twice and ends as soon as it reaches the goal state, so a plan with a
+    given number of crossings is generated if and only if solveSafeCrossing solves that instance.
+    Since the plans are generated one at a time, the consumer can stop early, for example
+    itertools.islice(iterSafeCrossings(...), k) gives the k shortest plans.
+
+    INPUTS:
+        initialState: State -> Initial node parameter given as a start point
+        goalState: State -> Final node to be reached for
+        boatCapacity: int -> The capacity of the boat
+        maxCrossings: int -> The number of maximum crossings of a plan
+    OUTPUTS:
+        GENERATOR OF PATH OBJECTS
+    """
+    queue = FifoFrontier()
+    queue.push(SearchNode(initialState))
+
+    while len(queue) != 0:
+        currentNode = queue.pop()
+        currentState = currentNode.state
+
+        if currentState == goalState:
+            yield currentNode.toPath()
+            continue
+
+        if currentNode.depth >= maxCrossings:
+            continue
+
+        for expansion in currentState.generateExpansions(boatCapacity):
+            # Plans that visit a state more than once are not distinct solutions
+            if not currentNode.contains(expansion):
+                queue.push(SearchNode(expansion, currentNode))
+
+
+def findCrossingIDAStar(initialState: State, goalState: State, boatCapacity: int, numCrossings: int,
+                        tableSize: int = 1 << 16) -> Path:
+    """
+    Applies iterative deepening A* to find a path with the minimum number of crossings, as long as
+    it does not exceed numCrossings crossings, using memory that does not grow with the population.
+
+    Each iteration is a depth first search that prunes a path once its crossings plus the lower bound
+    of estimateRemainingCrossings (together with estimateEqualGroupCrossings if the groups are equal)
+    exceed the current threshold. The next threshold is the smallest
+    value that has been pruned, and the search stops when it exceeds numCrossings. Only the current
+    path is kept: the depth first search holds one iterator of neighbors per state on the path, and
+    a set of the states on the path prevents looping.
+
+    Without any memory of the other paths, the same states would be expanded again through every
+    path that reaches them. Hence a transposition table of at most tableSize states remembers the
+    fewest crossings each state has been expanded with in the current iteration, and a state reached
+    again with no fewer crossings is pruned. Once the table is full, new states are not remembered,
+    so the memory is bounded by the depth of the plan plus tableSize.
+
+    INPUTS:
+        initialState: State -> Initial node parameter given as a start point
+        goalState: State -> Final node to be reached for
+        boatCapacity: int -> The capacity of the boat
+        numCrossings: int -> The number of maximum crossings
+        tableSize: int = 65536 (default) -> Maximum number of states in the transposition table
+    OUTPUTS:
+        SHORTEST SOLUTION PATH WITH AT MOST numCrossings CROSSINGS IF FOUND ANY, EMPTY PATH OTHERWISE
+    """
+    if initialState == goalState:
+        return Path([initialState])
+
+    # Reject the instances that can not be solved with at most numCrossings crossings
+    if not (isCrossingPossible(initialState, goalState, boatCapacity, numCrossings) or
+            isCrossingPossible(initialState, goalState, boatCapacity, numCrossings - 1)):
+        return Path()
+
+    if isStandardGoal(goalState) and initialState.cannibalsOnWest + initialState.cannibalsOnEast == \
+            initialState.missionariesOnWest + initialState.missionariesOnEast:
+        # The general bound is about half of the real number with equal groups
+        heuristic = lambda state: max(estimateRemainingCrossings(state, boatCapacity),
+                                      estimateEqualGroupCrossings(state, boatCapacity))
+    elif isStandardGoal(goalState):
+        heuristic = lambda state: estimateRemainingCrossings(state, boatCapacity)
+    else:
+        heuristic = lambda state: 0
+
+    def getOrderedExpansions(state: State):
+        # Neighbors that are estimated to be closer to the goal are tried first
+        return iter(sorted(state.generateExpansions(boatCapacity), key=heuristic))
+
+    threshold = heuristic(initialState)
+    while threshold <= numCrossings:
+        # Smallest estimate that exceeded the threshold in this iteration
+        nextThreshold = math.inf
+        # Fewest crossings each state has been expanded with in this iteration
+        transpositions = {initialState: 0}
+
+        states = [initialState]
+        statesOnPath = {initialState}
+        iterators = [getOrderedExpansions(initialState)]
+
+        while iterators:
+            expansion = next(iterators[-1], None)
+            if expansion is None:
+                # Every neighbor of the terminal state has been tried, backtrack
+                iterators.pop()
+                statesOnPath.discard(states.pop())
+                continue
+            if expansion in statesOnPath:
+                continue
+
+            crossings = len(states)
+            estimate = crossings + heuristic(expansion)
+            if estimate > threshold:
+                nextThreshold = min(nextThreshold, estimate)
+                continue
+
+            if expansion == goalState:
+                states.append(expansion)
+                return Path(states)
+
+            # Skip the state if it has already been expanded with no more crossings
+            previousCrossings = transpositions.get(expansion)
+            if previousCrossings is not None and previousCrossings <= crossings:
+                continue
+            if previousCrossings is not None or len(transpositions) < tableSize:
+                transpositions[expansion] = crossings
+
+            states.append(expansion)
+            statesOnPath.add(expansion)
+            iterators.append(getOrderedExpansions(expansion))
+
+        threshold = nextThreshold
+
+    return Path()
+
+
+def solvePortfolioTask(task: tuple) -> SearchResult:
+    """
+    Runs one seeded copy of the random search in a worker process of solvePortfolio.
+
+    INPUTS:
+        task: tuple -> (initialState, goalState, boatCapacity, numCrossings, seed, budget) tuple
+    OUTPUTS:
+        SEARCHRESULT OBJECT
+    """
+    initialState, goalState, boatCapacity, numCrossings, seed, budget = task
+    return solveSafeCrossing(initialState, goalState, boatCapacity, numCrossings, "random", seed, budget)
+
+
+def solvePortfolio(initialState: State, goalState: State, boatCapacity: int, numCrossings: int,
+                   numRuns: int = None, seeds: list = None, workers: int = None,
+                   budget: SearchBudget = None) -> SearchResult:
+    """
+    Runs independently seeded copies of the random search of solveSafeCrossing on a pool of worker
+    processes and returns the first solution, which cuts the long tail of the run time of a single seed.
+
+    As soon as a copy finds a path with exactly numCrossings crossings, the remaining copies are
+    terminated. The seed of the winning copy is given in the result. A copy that runs out of paths
+    without a solution has searched exhaustively, hence its INFEASIBLE verdict is returned at once
+    as well. If every copy runs out of its budget instead, nothing is proven and the result is
+    BUDGET_EXHAUSTED.
+
+    INPUTS:
+        initialState: State -> Initial node parameter given as a start point
+        goalState: State -> Final node to be reached for
+        boatCapacity: int -> The capacity of the boat
+        numCrossings: int -> The number of crossings of the solution
+        numRuns: int = None (default) -> Number of copies, the number of CPUs if None (ignored if seeds are given)
+        seeds: list = None (default) -> Seeds of the copies, 0 to numRuns - 1 if None
+        workers: int = None (default) -> Number of worker processes, at most the number of CPUs
+        budget: SearchBudget = None (default) -> Limits of each copy, 10000 nodes if None
+    OUTPUTS:
+        SEARCHRESULT OBJECT OF THE WINNING COPY
+    """
+    import multiprocessing
+    import os
+
+    startTime = time.perf_counter()
+    if seeds is None:
+        seeds = range(numRuns if numRuns is not None else os.cpu_count() or 1)
+    seeds = list(seeds)
+    if budget is None:
+        budget = SearchBudget(maxNodes=10000)
+    if workers is None:
+        workers = min(len(seeds), os.cpu_count() or 1)
+
+    # Impossible instances do not need any worker
+    if not isCrossingPossible(initialState, goalState, boatCapacity, numCrossings):
+        return SearchResult(None, INFEASIBLE, Path(), 0, time.perf_counter() - startTime)
+
+    tasks = [(initialState, goalState, boatCapacity, numCrossings, seed, budget) for seed in seeds]
+    results = []
+
+    # Leaving the block terminates the workers that are still searching
+    with multiprocessing.Pool(workers) as pool:
+        for result in pool.imap_unordered(solvePortfolioTask, tasks):
+            # Both a solution and an exhaustive search decide the instance
+            if result.status != BUDGET_EXHAUSTED:
+                result.elapsedSeconds = time.perf_counter() - startTime
+                return result
+            results.append(result)
+
+    if not results:
+        return SearchResult(None, BUDGET_EXHAUSTED, Path(), 0, time.perf_counter() - startTime)
+
+    # Report the copy whose partial progress got the closest to the goal state
+    closest = min(results, key=lambda result: (estimateRemainingCrossings(result.bestPath.getTerminalState(),
+                                                                          boatCapacity)
+                                               if result.bestPath.getLength() != 0 else math.inf))
+    return SearchResult(None, BUDGET_EXHAUSTED, closest.bestPath, sum(result.nodesExpanded for result in results),
+                        time.perf_counter() - startTime, closest.seed)
+
+
+def runDistributedWorker(workerId: int, numWorkers: int, names: tuple, numC: int, numM: int, boatCapacity: int,
+                         initialIndex: int, goalIndex: int, typeCode: str, outboxSize: int, barrier) -> None:
+    """
+    Expands the states owned by one worker process of findDistributedCrossing, layer by layer.
+
+    A worker owns the states whose index modulo numWorkers is its id. In the first phase of a layer
+    it expands its own frontier, records a parent for every unvisited neighbor and writes the
+    neighbor into its outbox for the owner of the neighbor. In the second phase it reads its inbox
+    in the outboxes of all the workers, marks the new states as visited and builds its next
+    frontier. Both phases end at the barrier. The search stops when the goal state is visited or
+    every frontier is empty.
+
+    INPUTS:
+        workerId: int -> Id of the worker
+        numWorkers: int -> Number of workers
+        names: tuple -> Names of the shared memory blocks of the distances, the parents, the outboxes and the counts
+        numC: int -> Number of cannibals
+        numM: int -> Number of missionaries
+        boatCapacity: int -> The capacity of the boat
+        initialIndex: int -> Index of the initial state
+        goalIndex: int -> Index of the goal state
+        typeCode: str -> Type code of the arrays of state indices
+        outboxSize: int -> Capacity of the outbox of a worker for one owner
+        barrier: multiprocessing.Barrier -> Barrier that separates the phases
+    OUTPUTS:
+        NONE
+    """
+    from multiprocessing import shared_memory
+
+    blocks = [shared_memory.SharedMemory(name=name) for name in names]
+    views = []
+    try:
+        distances = blocks[0].buf.cast("i")
+        parents = blocks[1].buf.cast(typeCode)
+        outboxes = blocks[2].buf.cast(typeCode)
+        counts = blocks[3].buf.cast("q")
+        views = [distances, parents, outboxes, counts]
+
+        rowSize = numM + 1
+        sideSize = (numC + 1) * rowSize
+        loads = getBoatLoads(boatCapacity)
+        # Offset of the counts of the frontier sizes after the outbox counts
+        frontierSizeOffset = numWorkers * numWorkers
+
+        frontier = [initialIndex] if initialIndex % numWorkers == workerId else []
+        distance = 0
+
+        while True:
+            # Phase 1: expand the own frontier into the outboxes
+            outboxCounts = [0] * numWorkers
+            proposed = set()
+            for index in frontier:
+                side, rest = divmod(index, sideSize)
+                cannibalsOnWest, missionariesOnWest = divmod(rest, rowSize)
+                direction = -1 if side == 0 else 1
+                neighborSideOffset = (1 - side) * sideSize
+                for cannibals, missionaries in loads:
+                    newCannibals = cannibalsOnWest + direction * cannibals
+                    newMissionaries = missionariesOnWest + direction * missionaries
+                    if not (0 <= newCannibals <= numC and 0 <= newMissionaries <= numM):
+                        continue
+                    # Missionaries can not be outnumbered on either side
+                    if 0 < newMissionaries < newCannibals:
+                        continue
+                    if 0 < numM - newMissionaries < numC - newCannibals:
+                        continue
+                    neighbor = neighborSideOffset + newCannibals * rowSize + newMissionaries
+                    if distances[neighbor] != -1 or neighbor in proposed:
+                        continue
+                    proposed.add(neighbor)
+                    # Any state of the current layer is a valid parent, concurrent writes are harmless
+                    parents[neighbor] = index
+                    owner = neighbor % numWorkers
+                    outboxes[(workerId * numWorkers + owner) * outboxSize + outboxCounts[owner]] = neighbor
+                    outboxCounts[owner] += 1
+            for owner in range(numWorkers):
+                counts[workerId * numWorkers + owner] = outboxCounts[owner]
+            barrier.wait()
+
+            # Phase 2: collect the own states from the outboxes of every worker
+            distance += 1
+            frontier = []
+            for sender in range(numWorkers):
+                offset = (sender * numWorkers + workerId) * outboxSize
+                for position in range(offset, offset + counts[sender * numWorkers + workerId]):
+                    neighbor = outboxes[position]
+                    if distances[neighbor] == -1:
+                        distances[neighbor] = distance
+                        frontier.append(neighbor)
+            counts[frontierSizeOffset + workerId] = len(frontier)
+            barrier.wait()
+
+            if distances[goalIndex] != -1 or not any(counts[frontierSizeOffset:frontierSizeOffset + numWorkers]):
+                break
+    except BaseException:
+        # Release the other workers instead of leaving them at the barrier
+        barrier.abort()
+        raise
+    finally:
+        for view in views:
+            view.release()
+        for block in blocks:
+            block.close()
+
+
+def findDistributedCrossing(initialState: State, goalState: State, boatCapacity: int, workers: int = None) -> Path:
+    """
+    Applies a level-synchronous breadth first search split across worker processes to find a path
+    with the minimum number of crossings.
+
+    The states are indexed like in CrossingTable and partitioned among the workers by their index.
+    The distances, the parents and the frontiers exchanged between the workers live in shared memory
+    blocks as arrays of integers, so no State objects are created or pickled during the search. The
+    outboxes take numWorkers * 2 * (C + 1) * (M + 1) integers, since a worker may send every state
+    of an owner to it in one layer. See runDistributedWorker for the steps of a layer.
+
+    INPUTS:
+        initialState: State -> Initial node parameter given as a start point
+        goalState: State -> Final node to be reached for
+        boatCapacity: int -> The capacity of the boat
+        workers: int = None (default) -> Number of worker processes, the number of CPUs if None
+    OUTPUTS:
+        SHORTEST SOLUTION PATH IF FOUND ANY, EMPTY PATH OTHERWISE
+    """
+    import multiprocessing
+    import os
+    from multiprocessing import shared_memory
+
+    if initialState == goalState:
+        return Path([initialState])
+    if not initialState.isStateSafe() or not goalState.isStateSafe():
+        return Path()
+
+    numC = initialState.cannibalsOnWest + initialState.cannibalsOnEast
+    numM = initialState.missionariesOnWest + initialState.missionariesOnEast
+    numWorkers = workers if workers is not None else os.cpu_count() or 1
+
+    def getIndex(state: State) -> int:
+        side = 0 if state.boatSide == "west" else 1
+        return (side * (numC + 1) + state.cannibalsOnWest) * (numM + 1) + state.missionariesOnWest
+
+    size = 2 * (numC + 1) * (numM + 1)
+    typeCode = "i" if size < 1 << 31 else "q"
+    itemSize = array(typeCode).itemsize
+    outboxSize = -(-size // numWorkers)
+    initialIndex = getIndex(initialState)
+    goalIndex = getIndex(goalState)
+
+    blocks = []
+    try:
+        blocks.append(shared_memory.SharedMemory(create=True, size=size * 4))
+        blocks.append(shared_memory.SharedMemory(create=True, size=size * itemSize))
+        blocks.append(shared_memory.SharedMemory(create=True, size=numWorkers * numWorkers * outboxSize * itemSize))
+        blocks.append(shared_memory.SharedMemory(create=True, size=(numWorkers * numWorkers + numWorkers) * 8))
+
+        distances = blocks[0].buf.cast("i")
+        try:
+            # Every state is unvisited (-1) except the initial state
+            distances[:] = array("i", [-1]) * size
+            distances[initialIndex] = 0
+        finally:
+            distances.release()
+
+        barrier = multiprocessing.Barrier(numWorkers)
+        names = tuple(block.name for block in blocks)
+        processes = [multiprocessing.Process(target=runDistributedWorker,
+                                             args=(workerId, numWorkers, names, numC, numM, boatCapacity,
+                                                   initialIndex, goalIndex, typeCode, outboxSize, barrier))
+                     for workerId in range(numWorkers)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+        if any(process.exitcode != 0 for process in processes):
+            raise RuntimeError("A worker of the distributed search failed")
+
+        distances = blocks[0].buf.cast("i")
+        parents = blocks[1].buf.cast(typeCode)
+        try:
+            if distances[goalIndex] == -1:
+                return Path()
+            # Follow the parents from the goal state back to the initial state
+            indices = [goalIndex]
+            while indices[-1] != initialIndex:
+                indices.append(parents[indices[-1]])
+        finally:
+            distances.release()
+            parents.release()
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+    states = []
+    for index in reversed(indices):
+        rest, missionariesOnWest = divmod(index, numM + 1)
+        side, cannibalsOnWest = divmod(rest, numC + 1)
+        states.append(State(cannibalsOnWest, missionariesOnWest, "west" if side == 0 else "east",
+                            numC - cannibalsOnWest, numM - missionariesOnWest))
+    return Path(states)
+
+
+# Largest number of bank configurations whose safety is memoized in a table by RiverProblem
+SAFETY_TABLE_LIMIT = 1 << 22
+
+# Entries of the safety table of RiverProblem, configurations are checked when they are first reached
+SAFETY_UNKNOWN = 0
+SAFETY_SAFE = 1
+SAFETY_UNSAFE = 2
+
+
+class RiverProblem:
+    """
+    RiverProblem is a generalized river crossing problem with any number of passenger groups and boats.
+
+    A state is packed into a single integer in mixed radix: the lower digits are the number of people
+    of each group on the west side (radix group size + 1), and the upper bits are the sides of the
+    boats (0 for west, 1 for east). Each crossing moves one boat with at least one person. A safety
+    rule (predator, prey) means the prey group can not be outnumbered by the predator group wherever
+    there is any prey, on either bank or on a boat.
+
+    The boat loads of every boat are compiled once in the constructor, and for small problems the
+    safety of a bank configuration is memoized in a table by its packed counts when the search first
+    reaches it, so the search works on the packed integers directly instead of creating an object
+    per state, and a search that visits few configurations does not pay for the others.
+    """
+
+    def __init__(self, groupSizes: tuple, boatCapacities: tuple, safetyRules: tuple = (), groupNames: tuple = None) -> None:
+        """
+        Constructor of the RiverProblem class.
+
+        INPUTS:
+            groupSizes: tuple -> Number of people of each group, all of them start on the west side
+            boatCapacities: tuple -> Capacity of each boat, all of them start on the west side
+            safetyRules: tuple = () (default) -> (predator group, prey group) index pairs
+            groupNames: tuple = None (default) -> Names of the groups, used by describeState
+        OUTPUTS:
+            SELF OBJECT (<type RiverProblem>)
+        """
+        self.groupSizes = tuple(groupSizes)
+        self.boatCapacities = tuple(boatCapacities)
+        self.safetyRules = tuple(safetyRules)
+        self.groupNames = tuple(groupNames) if groupNames is not None else tuple(
+            "GROUP%d" % group for group in range(len(self.groupSizes)))
+
+        # Place value of each group digit, and the number of bank configurations
+        self.multipliers = []
+        countsSpace = 1
+        for size in self.groupSizes:
+            self.multipliers.append(countsSpace)
+            countsSpace *= size + 1
+        self.countsSpace = countsSpace
+
+        # (load vector, packed load) pairs of each boat
+        self.boatLoads = tuple(self.compileLoads(capacity) for capacity in self.boatCapacities)
+
+        # Memoized safety of the bank configurations by their packed counts, None if the problem is too large
+        self.safetyTable = bytearray(countsSpace) if countsSpace <= SAFETY_TABLE_LIMIT else None
+
+    @classmethod
+    def classic(cls, numC: int, numM: int, boatCapacity: int):
+        """
+        Creates the missionaries and cannibals problem of the State class as a RiverProblem
+
+        INPUTS:
+            numC: int -> Number of cannibals
+            numM: int -> Number of missionaries
+            boatCapacity: int -> The capacity of the boat
+        OUTPUTS:
+            RIVERPROBLEM OBJECT WITH THE GROUPS (CANNIBALS, MISSIONARIES) AND ONE BOAT
+        """
+        return cls((numC, numM), (boatCapacity,), ((0, 1),), ("CANNIBALS", "MISSIONARIES"))
+
+    def isGroupSafe(self, counts) -> bool:
+        """
+        Checks the safety rules for the given number of people of each group in one place
+
+        INPUTS:
+            counts: sequence -> Number of people of each group
+        OUTPUTS:
+            TRUE IF NO PREY GROUP IS OUTNUMBERED BY ITS PREDATOR GROUP ELSE FALSE
+        """
+        for predator, prey in self.safetyRules:
+            if 0 < counts[prey] < counts[predator]:
+                return False
+        return True
+
+    def isConfigurationSafe(self, westCounts) -> bool:
+        """
+        Checks the safety rules on both banks for the given counts on the west side
+
+        INPUTS:
+            westCounts: sequence -> Number of people of each group on the west side
+        OUTPUTS:
+            TRUE IF BOTH BANKS ARE SAFE ELSE FALSE
+        """
+        eastCounts = [size - count for size, count in zip(self.groupSizes, westCounts)]
+        return self.isGroupSafe(westCounts) and self.isGroupSafe(eastCounts)
+
+    def compileLoads(self, capacity: int) -> tuple:
+        """
+        Generates the safe loads of a boat with the given capacity
+
+        INPUTS:
+            capacity: int -> The capacity of the boat
+        OUTPUTS:
+            TUPLE OF (LOAD VECTOR, PACKED LOAD) PAIRS
+        """
+        loads = []
+        ranges = [range(min(size, capacity) + 1) for size in self.groupSizes]
+        for load in itertools.product(*ranges):
+            if 0 < sum(load) <= capacity and self.isGroupSafe(load):
+                packed = sum(count * multiplier for count, multiplier in zip(load, self.multipliers))
+                loads.append((load, packed))
+        return tuple(loads)
+
+    def unpackCounts(self, countsKey: int) -> list:
+        """
+        Unpacks the number of people of each group on the west side
+
+        INPUTS:
+            countsKey: int -> Packed counts (the state key modulo countsSpace)
+        OUTPUTS:
+            LIST OF THE COUNTS ON THE WEST SIDE
+        """
+        counts = []
+        for size in self.groupSizes:
+            countsKey, count = divmod(countsKey, size + 1)
+            counts.append(count)
+        return counts
+
+    def getInitialKey(self) -> int:
+        """
+        Gets the key of the state where everyone and every boat is on the west side
+
+        INPUTS:
+            NONE
+        OUTPUTS:
+            PACKED KEY OF THE INITIAL STATE
+        """
+        return sum(size * multiplier for size, multiplier in zip(self.groupSizes, self.multipliers))
+
+    def decodeState(self, key: int) -> tuple:
+        """
+        Decodes a packed state
+
+        INPUTS:
+            key: int -> Packed key of the state
+        OUTPUTS:
+            (COUNTS ON THE WEST SIDE, SIDES OF THE BOATS) PAIR OF TUPLES
+        """
+        boatMask, countsKey = divmod(key, self.countsSpace)
+        sides = tuple("east" if boatMask >> boat & 1 else "west" for boat in range(len(self.boatCapacities)))
+        return tuple(self.unpackCounts(countsKey)), sides
+
+    def describeState(self, key: int) -> str:
+        """
+        Describes a packed state in text
+
+        INPUTS:
+            key: int -> Packed key of the state
+        OUTPUTS:
+            TEXT OF THE STATE
+        """
+        westCounts, sides = self.decodeState(key)
+        groups = ", ".join("%s %d/%d" % (name, count, size - count)
+                           for name, count, size in zip(self.groupNames, westCounts, self.groupSizes))
+        return "WEST/EAST: %s; BOATS: %s" % (groups, ", ".join(sides))
+
+    def generateExpansions(self, key: int) -> list:
+        """
+        Generates the packed keys of the states reachable with one crossing
+
+        INPUTS:
+            key: int -> Packed key of the state
+        OUTPUTS:
+            LIST OF PACKED KEYS
+        """
+        countsSpace = self.countsSpace
+        safetyTable = self.safetyTable
+        boatMask, countsKey = divmod(key, countsSpace)
+        westCounts = self.unpackCounts(countsKey)
+        eastCounts = [size - count for size, count in zip(self.groupSizes, westCounts)]
+
+        expansions = []
+        for boat, loads in enumerate(self.boatLoads):
+            isOnEast = boatMask >> boat & 1
+            available = eastCounts if isOnEast else westCounts
+            newBoatMask = (boatMask ^ (1 << boat)) * countsSpace
+            for load, packed in loads:
+                if any(count > limit for count, limit in zip(load, available)):
+                    continue
+                newCountsKey = countsKey + packed if isOnEast else countsKey - packed
+                if safetyTable is not None:
+                    safety = safetyTable[newCountsKey]
+                    if safety == SAFETY_UNKNOWN:
+                        isSafe = self.isConfigurationSafe(self.unpackCounts(newCountsKey))
+                        safety = SAFETY_SAFE if isSafe else SAFETY_UNSAFE
+                        safetyTable[newCountsKey] = safety
+                    if safety == SAFETY_UNSAFE:
+                        continue
+                elif not self.isConfigurationSafe(self.unpackCounts(newCountsKey)):
+                    continue
+                expansions.append(newBoatMask + newCountsKey)
+        return expansions
+
+    def solve(self, maxCrossings: int = None) -> list:
+        """
+        Finds a plan with the minimum number of crossings that carries everyone to the east side,
+        by a breadth first search over the packed keys. The boats may end on either side.
+
+        INPUTS:
+            maxCrossings: int = None (default) -> The number of maximum crossings, unlimited if None
+        OUTPUTS:
+            LIST OF PACKED KEYS FROM THE INITIAL STATE TO THE GOAL, NONE IF THERE IS NO PLAN
+        """
+        countsSpace = self.countsSpace
+        initialKey = self.getInitialKey()
+        if not self.isConfigurationSafe(self.unpackCounts(initialKey)):
+            return None
+
+        # Previous key of each reached key
+        parents = {initialKey: None}
+        layer = [initialKey]
+        crossings = 0
+        goalKey = initialKey if initialKey % countsSpace == 0 else None
+
+        while goalKey is None and layer and (maxCrossings is None or crossings < maxCrossings):
+            crossings += 1
+            nextLayer = []
+            for key in layer:
+                for expansion in self.generateExpansions(key):
+                    if expansion in parents:
+                        continue
+                    parents[expansion] = key
+                    if expansion % countsSpace == 0:
+                        goalKey = expansion
+                        break
+                    nextLayer.append(expansion)
+                if goalKey is not None:
+                    break
+            layer = nextLayer
+
+        if goalKey is None:
+            return None
+        plan = []
+        key = goalKey
+        while key is not None:
+            plan.append(key)
+            key = parents[key]
+        plan.reverse()
+        return plan
+
+    def toPath(self, plan: list) -> Path:
+        """
+        Converts a plan of a problem created by classic into a Path of State objects
+
+        INPUTS:
+            plan: list -> Packed keys of the plan
+        OUTPUTS:
+            PATH OBJECT
+        """
+        numC, numM = self.groupSizes
+        states = []
+        for key in plan:
+            (cannibalsOnWest, missionariesOnWest), (side,) = self.decodeState(key)
+            states.append(State(cannibalsOnWest, missionariesOnWest, side, numC - cannibalsOnWest,
+                                numM - missionariesOnWest))
+        return Path(states)
+
+
+# Version of the database layout of SolutionCache, databases of older versions are cleared
+SOLUTION_CACHE_VERSION = 3
+
+
+class SolutionCache:
+    """
+    SolutionCache stores solved plans and infeasibility verdicts on disk, keyed by the scenario
+    (numC, numM, boatCapacity, numCrossings).
+
+    Only complete verdicts are stored: a plan is valid whatever strategy found it, and since the
+    search of solveSafeCrossing is exhaustive, its infeasibility verdicts do not depend on the
+    strategy or the seed either, hence the strategy is not a part of the key. Databases written by
+    an older version of the cache are cleared when they are opened.
+
+    The cache is an SQLite database in write-ahead logging mode, hence several processes can read
+    it while another one writes. Each process keeps a running count of the scenarios, and when an
+    insert grows the cache beyond maxEntries scenarios, the least recently used ones are evicted in
+    a batch of maxEntries / 16 scenarios. Plans are stored in a compact binary form: since the boat changes sides
+    in every crossing, only the west counts of each state are stored, as an array of 16 or 32 bit
+    integers after the side of the first state and the type code of the array.
+
+    The database connection is opened lazily in each process, so the object can be sent to the
+    worker processes of solveScenariosParallel.
+    """
+
+    def __init__(self, path: str, maxEntries: int = 100000) -> None:
+        """
+        Constructor of the SolutionCache class.
+
+        INPUTS:
+            path: str -> Path of the database file, created if it does not exist
+            maxEntries: int = 100000 (default) -> Maximum number of scenarios kept in the cache
+        OUTPUTS:
+            SELF OBJECT (<type SolutionCache>)
+        """
+        self.path = path
+        self.maxEntries = maxEntries
+        self.connection = None
+        self.processId = None
+        # Number of scenarios in the database as seen by the current process
+        self.entryCount = 0
+
+    def __getstate__(self) -> dict:
+        # The connection can not be shared between processes
+        return {"path": self.path, "maxEntries": self.maxEntries}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(state["path"], state["maxEntries"])
+
+    def getConnection(self):
+        """
+        Gets the database connection of the current process, opens it if needed
+
+        INPUTS:
+            NONE
+        OUTPUTS:
+            SQLITE3 CONNECTION OBJECT
+        """
+        import os
+        if self.connection is None or self.processId != os.getpid():
+            import sqlite3
+            connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            # Older versions may have stored verdicts of an incomplete search
+            if connection.execute("PRAGMA user_version").fetchone()[0] < SOLUTION_CACHE_VERSION:
+                connection.execute("DROP TABLE IF EXISTS solutions")
+                connection.execute("PRAGMA user_version = %d" % SOLUTION_CACHE_VERSION)
+            connection.execute("CREATE TABLE IF NOT EXISTS solutions (numC INTEGER, numM INTEGER, boatCapacity INTEGER, "
+                               "numCrossings INTEGER, status TEXT, plan BLOB, lastUsed REAL, "
+                               "PRIMARY KEY (numC, numM, boatCapacity, numCrossings))")
+            connection.execute("CREATE INDEX IF NOT EXISTS solutionsByLastUsed ON solutions (lastUsed)")
+            self.entryCount = connection.execute("SELECT COUNT(*) FROM solutions").fetchone()[0]
+            self.connection = connection
+            self.processId = os.getpid()
+        return self.connection
+
+    def close(self) -> None:
+        """
+        Closes the database connection of the current process
+
+        INPUTS:
+            NONE
+        OUTPUTS:
+            NONE
+        """
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+    @staticmethod
+    def encodePath(path: Path) -> bytes:
+        """
+        Encodes the states of a path into bytes
+
+        INPUTS:
+            path: Path -> The path to be encoded
+        OUTPUTS:
+            BYTES OF THE PATH
+        """
+        states = path.getContent()
+        counts = []
+        for state in states:
+            counts.append(state.cannibalsOnWest)
+            counts.append(state.missionariesOnWest)
+        typeCode = "H" if max(counts, default=0) < 1 << 16 else "I"
+        firstSide = b"\x00" if not states or states[0].boatSide == "west" else b"\x01"
+        return firstSide + typeCode.encode() + array(typeCode, counts).tobytes()
+
+    @staticmethod
+    def decodePath(data: bytes, numC: int, numM: int) -> Path:
+        """
+        Decodes a path encoded by encodePath
+
+        INPUTS:
+            data: bytes -> Bytes of the path
+            numC: int -> Number of cannibals of the scenario
+            numM: int -> Number of missionaries of the scenario
+        OUTPUTS:
+            PATH OBJECT
+        """
+        sides = ("west", "east")
+        side = data[0]
+        counts = array(chr(data[1]))
+        counts.frombytes(data[2:])
+        states = []
+        for index in range(0, len(counts), 2):
+            cannibalsOnWest = counts[index]
+            missionariesOnWest = counts[index + 1]
+            states.append(State(cannibalsOnWest, missionariesOnWest, sides[side],
+                                numC - cannibalsOnWest, numM - missionariesOnWest))
+            side = 1 - side
+        return Path(states)
+
+    def get(self, scenario: tuple) -> SearchResult:
+        """
+        Looks up a scenario in the cache and marks it as recently used
+
+        INPUTS:
+            scenario: tuple -> (numC, numM, boatCapacity, numCrossings) tuple
+        OUTPUTS:
+            SEARCHRESULT OBJECT IF THE SCENARIO IS IN THE CACHE, NONE OTHERWISE
+        """
+        import sqlite3
+        connection = self.getConnection()
+        row = connection.execute("SELECT status, plan FROM solutions WHERE numC = ? AND numM = ? AND boatCapacity = ? "
+                                 "AND numCrossings = ?", scenario).fetchone()
+        if row is None:
+            return None
+
+        try:
+            connection.execute("UPDATE solutions SET lastUsed = ? WHERE numC = ? AND numM = ? AND boatCapacity = ? "
+                               "AND numCrossings = ?", (time.time(),) + tuple(scenario))
+        except sqlite3.OperationalError:
+            # Another process is writing, the entry is marked as used on a later hit
+            pass
+
+        status, plan = row
+        path = self.decodePath(plan, scenario[0], scenario[1]) if plan is not None else None
+        return SearchResult(path, status, path if path is not None else Path(), 0, 0.0)
+
+    def put(self, scenario: tuple, result: SearchResult) -> None:
+        """
+        Stores the result of a scenario if it is a solution or an infeasibility verdict, and evicts
+        the least recently used scenarios if the cache is full. An infeasibility verdict must come
+        from a complete decision, such as isCrossingPossible or an exhaustive search of
+        solveSafeCrossing, and never from a search that ran out of its budget.
+
+        INPUTS:
+            scenario: tuple -> (numC, numM, boatCapacity, numCrossings) tuple
+            result: SearchResult -> Result of the scenario
+        OUTPUTS:
+            NONE
+        """
+        if result.status not in (SOLVED, INFEASIBLE):
+            return
+        plan = self.encodePath(result.path) if result.path is not None else None
+        row = tuple(scenario) + (result.status, plan, time.time())
+
+        connection = self.getConnection()
+        if connection.execute("INSERT OR IGNORE INTO solutions VALUES (?, ?, ?, ?, ?, ?, ?)", row).rowcount == 0:
+            connection.execute("UPDATE solutions SET status = ?, plan = ?, lastUsed = ? WHERE numC = ? AND numM = ? "
+                               "AND boatCapacity = ? AND numCrossings = ?", row[4:] + row[:4])
+            return
+
+        # Only an insert that grows the table can make it exceed the limit
+        self.entryCount += 1
+        if self.entryCount > self.maxEntries:
+            # Other processes may have inserted too, hence the table is counted before the eviction
+            self.entryCount = connection.execute("SELECT COUNT(*) FROM solutions").fetchone()[0]
+            if self.entryCount > self.maxEntries:
+                excess = self.entryCount - (self.maxEntries - self.maxEntries // 16)
+                connection.execute("DELETE FROM solutions WHERE rowid IN (SELECT rowid FROM solutions "
+                                   "ORDER BY lastUsed LIMIT ?)", (excess,))
+                self.entryCount -= excess
+
+
+# Fields of a scenario in the batch input
+SCENARIO_FIELDS = ("numC", "numM", "boatCapacity", "numCrossings")
+
+
+def solveScenario(numC: int, numM: int, boatCapacity: int, numCrossings: int, strategy: str = "random",
+                  seed: int = None, budget: SearchBudget = None, cache: SolutionCache = None) -> SearchResult:
+    """
+    Solves the problem of carrying numC cannibals and numM missionaries from the west side to the
+    east side of the river with exactly numCrossings crossings. If a cache is given, the scenario
+    is looked up in it first, and solutions and infeasibility verdicts are stored in it.
+
+    INPUTS:
+        numC: int -> Number of cannibals
+        numM: int -> Number of missionaries
+        boatCapacity: int -> The capacity of the boat
+        numCrossings: int -> The number of crossings of the solution
+        strategy: str = "random" (default) -> Search strategy of solveSafeCrossing
+        seed: int = None (default) -> Seed for the random strategy
+        budget: SearchBudget = None (default) -> Limits of the search, unlimited if None
+        cache: SolutionCache = None (default) -> Persistent cache of the results
+    OUTPUTS:
+        SEARCHRESULT OBJECT
+    """
+    scenario = (numC, numM, boatCapacity, numCrossings)
+    if cache is not None:
+        result = cache.get(scenario)
+        if result is not None:
+            return result
+
+    initialState = State(numC, numM, "west", 0, 0)
+    goalState = State(0, 0, "east", numC, numM)
+    result = solveSafeCrossing(initialState, goalState, boatCapacity, numCrossings, strategy, seed, budget)
+
+    if cache is not None:
+        cache.put(scenario, result)
+    return result
+
+
+def solveScenarioTask(task: tuple) -> tuple:
+    """
+    Solves one scenario in a worker process of solveScenariosParallel.
+
+    INPUTS:
+        task: tuple -> (index, scenario, strategy, seed, budget, cache) tuple, scenario is a (numC, numM, boatCapacity, numCrossings) tuple
+    OUTPUTS:
+        (INDEX, SEARCHRESULT OBJECT) PAIR
+    """
+    index, scenario, strategy, seed, budget, cache = task
+    return index, solveScenario(*scenario, strategy=strategy, seed=seed, budget=budget, cache=cache)
+
+
+def solveScenariosParallel(scenarios, workers: int = None, chunkSize: int = 8, ordered: bool = True,
+                           strategy: str = "random", seed: int = None, budget: SearchBudget = None,
+                           cache: SolutionCache = None):
+    """
+    Solves many independent scenarios on a pool of worker processes.
+
+    The scenarios are sent to the workers in chunks of chunkSize to reduce the communication
+    between the processes. Every search is limited by the budget, so a slow scenario can not hold
+    up the batch; by default a search expands at most 10000 nodes like findSafeCrossing. The
+    results are generated lazily, and leaving the generator early terminates the workers.
+
+    INPUTS:
+        scenarios: iterable -> (numC, numM, boatCapacity, numCrossings) tuples
+        workers: int = None (default) -> Number of worker processes, the number of CPUs if None
+        chunkSize: int = 8 (default) -> Number of scenarios sent to a worker at once
+        ordered: bool = True (default) -> Generate the results in input order instead of completion order
+        strategy: str = "random" (default) -> Search strategy of solveSafeCrossing
+        seed: int = None (default) -> Seed for the random strategy
+        budget: SearchBudget = None (default) -> Limits of each search, 10000 nodes if None
+        cache: SolutionCache = None (default) -> Persistent cache shared by the workers
+    OUTPUTS:
+        GENERATOR OF (INDEX OF THE SCENARIO, SEARCHRESULT OBJECT) PAIRS
+    """
+    import multiprocessing
+
+    if budget is None:
+        budget = SearchBudget(maxNodes=10000)
+
+    tasks = ((index, tuple(scenario), strategy, seed, budget, cache) for index, scenario in enumerate(scenarios))
+
+    with multiprocessing.Pool(workers) as pool:
+        if ordered:
+            results = pool.imap(solveScenarioTask, tasks, chunkSize)
+        else:
+            results = pool.imap_unordered(solveScenarioTask, tasks, chunkSize)
+        for result in results:
+            yield result
+
+
+def readScenarios(stream, inputFormat: str = "jsonl"):
+    """
+    Lazily reads scenarios from a stream, one scenario per line.
+
+    A JSONL line is an object with the fields of SCENARIO_FIELDS, a CSV stream starts with a header
+    row that names them. Each field must be a non-negative integer: a JSON integer or a CSV cell of
+    digits, hence values such as 3.9 or "3" in JSON are rejected instead of being truncated. Lines
+    that can not be parsed are generated as the error message instead of a scenario, so that the
+    caller can report them without stopping the batch.
+
+    INPUTS:
+        stream: file -> Text stream to read the scenarios from
+        inputFormat: str = "jsonl" (default) -> Format of the stream, "jsonl" or "csv"
+    OUTPUTS:
+        GENERATOR OF (LINE NUMBER, SCENARIO TUPLE OR ERROR MESSAGE) PAIRS
+    """
+    if inputFormat == "csv":
+        import csv
+        rows = csv.DictReader(stream)
+        # The header is the first line
+        numberedRows = ((rows.line_num, row) for row in rows)
+    elif inputFormat == "jsonl":
+        import json
+        numberedRows = ((lineNumber, line) for lineNumber, line in enumerate(stream, 1) if line.strip())
+    else:
+        raise ValueError("Unknown input format '%s', expected jsonl or csv" % inputFormat)
+
+    def parseField(row, field: str) -> int:
+        value = row[field]
+        if inputFormat == "csv":
+            value = value.strip() if value is not None else ""
+            if value.isdigit():
+                return int(value)
+        elif type(value) is int and value >= 0:
+            # bool is a subclass of int, hence the exact type is checked
+            return value
+        raise ValueError("%s must be a non-negative integer, got %r" % (field, value))
+
+    for lineNumber, row in numberedRows:
+        try:
+            if inputFormat == "jsonl":
+                row = json.loads(row)
+            yield lineNumber, tuple(parseField(row, field) for field in SCENARIO_FIELDS)
+        except (ValueError, KeyError, TypeError) as error:
+            yield lineNumber, "invalid scenario: %s" % error
+
+
+def runBatch(inputStream, outputStream, inputFormat: str = "jsonl", strategy: str = "random", seed: int = None,
+             budget: SearchBudget = None, cache: SolutionCache = None) -> int:
+    """
+    Solves the scenarios of the input stream one by one and writes one JSON line per scenario
+    to the output stream, without reading the whole input first.
+
+    A result line holds the scenario, the status, the number of crossings, the plan as a list of
+    [cannibals on west, missionaries on west, boat side] states and the time of the search.
+    Identical scenarios are solved only once: the result of a repeated scenario is written as a
+    reference to the line of its first occurrence.
+
+    INPUTS:
+        inputStream: file -> Text stream to read the scenarios from
+        outputStream: file -> Text stream to write the results to
+        inputFormat: str = "jsonl" (default) -> Format of the input, "jsonl" or "csv"
+        strategy: str = "random" (default) -> Search strategy of solveSafeCrossing
+        seed: int = None (default) -> Seed for the random strategy
+        budget: SearchBudget = None (default) -> Limits of each search, unlimited if None
+        cache: SolutionCache = None (default) -> Persistent cache of the results
+    OUTPUTS:
+        NUMBER OF SCENARIOS THAT COULD NOT BE PARSED
+    """
+    import json
+
+    # Line number of the first occurrence of each solved scenario
+    firstLines = {}
+    errors = 0
+
+    for lineNumber, scenario in readScenarios(inputStream, inputFormat):
+        if isinstance(scenario, str):
+            errors += 1
+            line = {"line": lineNumber, "status": "error", "error": scenario}
+        elif scenario in firstLines:
+            line = {"line": lineNumber, "duplicateOf": firstLines[scenario]}
+        else:
+            firstLines[scenario] = lineNumber
+            result = solveScenario(*scenario, strategy=strategy, seed=seed, budget=budget, cache=cache).toDict()
+            line = {"line": lineNumber}
+            line.update(zip(SCENARIO_FIELDS, scenario))
+            line.update(status=result["status"], crossings=result["crossings"], plan=result["path"],
+                        seconds=result["elapsedSeconds"])
+        outputStream.write(json.dumps(line) + "\n")
+
+    return errors
+
+
+def runBatchCommand(arguments: list) -> int:
+    """
+    Parses the command line arguments of the batch mode and runs the batch.
+
+    INPUTS:
+        arguments: list -> Command line arguments
+    OUTPUTS:
+        EXIT CODE OF THE PROCESS
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Solve missionaries and cannibals scenarios in batch mode.")
+    parser.add_argument("input", help="JSONL or CSV file of scenarios, - for the standard input")
+    parser.add_argument("-o", "--output", default="-", help="file to write the results to, - for the standard output")
+    parser.add_argument("--format", choices=("jsonl", "csv"), help="input format, guessed from the file name if omitted")
+    parser.add_argument("--strategy", choices=STRATEGIES, default="random", help="search strategy")
+    parser.add_argument("--seed", type=int, default=None, help="seed of the random strategy")
+    parser.add_argument("--max-nodes", type=int, default=10000, help="node budget of each search")
+    parser.add_argument("--max-seconds", type=float, default=None, help="time budget of each search")
+    parser.add_argument("--cache", metavar="FILE", help="persistent cache of the solutions")
+    options = parser.parse_args(arguments)
+
+    inputFormat = options.format
+    if inputFormat is None:
+        inputFormat = "csv" if options.input.lower().endswith(".csv") else "jsonl"
+
+    budget = SearchBudget(maxNodes=options.max_nodes, maxSeconds=options.max_seconds)
+    cache = SolutionCache(options.cache) if options.cache else None
+    inputStream = sys.stdin if options.input == "-" else open(options.input, newline="")
+    outputStream = sys.stdout if options.output == "-" else open(options.output, "w")
+    try:
+        errors = runBatch(inputStream, outputStream, inputFormat, options.strategy, options.seed, budget, cache)
+    finally:
+        if cache is not None:
+            cache.close()
+        if inputStream is not sys.stdin:
+            inputStream.close()
+        if outputStream is not sys.stdout:
+            outputStream.close()
+
+    return 1 if errors > 0 else 0
+
+
+# MAIN
+if __name__ == "__main__":
+    # Scenarios given through the command line are solved in batch mode
+    if len(sys.argv) > 1:
+        sys.exit(runBatchCommand(sys.argv[1:]))
 
-# MAIN
-if __name__ == "__main__":
     # Get the necessary inputs from the command prompt
     numC = int(input("Please enter number of cannibals: "))
     numM = int(input("Please enter number of missionaries: "))
@@ -0,0 +1,373 @@
+"""
+Long-running solver service for the missionaries and cannibals problem.
+
+Clients connect over localhost TCP or a Unix socket and send one JSON request per line, for example
+{"numC": 6, "numM": 6, "boatCapacity": 5, "numCrossings": 7}. Each request is answered with one JSON
+line that holds the result of solveScenario. A request may also give "strategy", "seed",
+"maxNodes" and "maxSeconds", and an "id" that is echoed in the response. The request
+{"op": "metrics"} returns the throughput and latency metrics of the service.
+
+Searches run on a pool of worker processes, so the event loop stays responsive. Concurrent identical
+requests are coalesced into a single search, and a search that no request waits for any more is
+cancelled before it reaches a worker.
+
+EXAMPLE USAGE:
+    python solver_service.py --port 8765
+    python solver_service.py --unix /tmp/solver.sock
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from missionaries_and_cannibals import SCENARIO_FIELDS, STRATEGIES, SearchBudget, solveScenario
+
+# Number of recent requests used for the latency percentiles
+LATENCY_WINDOW = 1000
+
+
+class ServiceMetrics:
+    """
+    ServiceMetrics holds the counters of the service and the latencies of the recent requests.
+    """
+
+    def __init__(self) -> None:
+        """
+        Constructor of the ServiceMetrics class.
+
+        INPUTS:
+            NONE
+        OUTPUTS:
+            SELF OBJECT (<type ServiceMetrics>)
+        """
+        self.startTime = time.perf_counter()
+        # Number of answered scenario requests
+        self.requests = 0
+        # Number of searches run on the workers
+        self.solves = 0
+        # Number of requests that joined a search of an identical request
+        self.coalesced = 0
+        # Number of requests that failed or timed out
+        self.errors = 0
+        # Latencies of the recent requests in seconds
+        self.latencies = deque(maxlen=LATENCY_WINDOW)
+
+    def toDict(self, inflight: int) -> dict:
+        """
+        Converts the metrics into a dictionary
+
+        INPUTS:
+            inflight: int -> Number of searches that are running
+        OUTPUTS:
+            DICTIONARY OF THE METRICS
+        """
+        uptime = time.perf_counter() - self.startTime
+        latencies = sorted(self.latencies)
+
+        def getPercentile(percent: float) -> float:
+            if not latencies:
+                return None
+            return latencies[min(len(latencies) - 1, int(len(latencies) * percent / 100))]
+
+        return {
+            "uptimeSeconds": uptime,
+            "requests": self.requests,
+            "solves": self.solves,
+            "coalesced": self.coalesced,
+            "errors": self.errors,
+            "inflight": inflight,
+            "requestsPerSecond": self.requests / uptime if uptime > 0 else 0.0,
+            "latencySeconds": {"p50": getPercentile(50), "p95": getPercentile(95), "p99": getPercentile(99)},
+        }
+
+
+class SolverService:
+    """
+    SolverService answers the JSON requests of the clients. Searches are run on a process pool, and
+    a search is shared by every request with the same scenario, strategy, seed and budget that
+    arrives while it is queued or running.
+
+    A search is handed to the pool only when a worker is free, so its timeout starts when a worker
+    picks it up instead of when the request arrives. A worker stays reserved until its search
+    returns, even if the search has timed out, since a running search can not be interrupted.
+    """
+
+    def __init__(self, workers: int = None, maxSeconds: float = 10.0, maxNodes: int = None) -> None:
+        """
+        Constructor of the SolverService class.
+
+        INPUTS:
+            workers: int = None (default) -> Number of worker processes, the number of CPUs if None
+            maxSeconds: float = 10.0 (default) -> Upper limit of the time budget of a request
+            maxNodes: int = None (default) -> Upper limit of the node budget of a request, unlimited if None
+        OUTPUTS:
+            SELF OBJECT (<type SolverService>)
+        """
+        self.workers = workers if workers is not None else os.cpu_count() or 1
+        self.executor = ProcessPoolExecutor(self.workers)
+        self.maxSeconds = maxSeconds
+        self.maxNodes = maxNodes
+        self.metrics = ServiceMetrics()
+        # Queued and running searches by their key, and the number of requests waiting for each
+        self.inflight = {}
+        self.waiters = {}
+        # Free workers of the pool
+        self.freeWorkers = asyncio.Semaphore(self.workers)
+
+    def close(self) -> None:
+        """
+        Stops the worker processes
+
+        INPUTS:
+            NONE
+        OUTPUTS:
+            NONE
+        """
+        self.executor.shutdown(cancel_futures=True)
+
+    def getBudget(self, request: dict) -> SearchBudget:
+        """
+        Builds the budget of a request, limited by the budget of the service
+
+        INPUTS:
+            request: dict -> The request
+        OUTPUTS:
+            SEARCHBUDGET OBJECT
+        """
+        maxSeconds = request.get("maxSeconds")
+        maxSeconds = self.maxSeconds if maxSeconds is None else min(float(maxSeconds), self.maxSeconds)
+        maxNodes = request.get("maxNodes")
+        if maxNodes is not None:
+            maxNodes = int(maxNodes) if self.maxNodes is None else min(int(maxNodes), self.maxNodes)
+        else:
+            maxNodes = self.maxNodes
+        return SearchBudget(maxNodes=maxNodes, maxSeconds=maxSeconds)
+
+    async def solve(self, request: dict) -> dict:
+        """
+        Solves the scenario of a request, joining the running search of an identical request if there is any
+
+        INPUTS:
+            request: dict -> The request
+        OUTPUTS:
+            DICTIONARY OF THE RESULT
+        """
+        scenario = tuple(int(request[field]) for field in SCENARIO_FIELDS)
+        strategy = request.get("strategy", "random")
+        if strategy not in STRATEGIES:
+            raise ValueError("unknown strategy '%s'" % strategy)
+        seed = request.get("seed")
+        budget = self.getBudget(request)
+        key = (scenario, strategy, seed, budget.maxNodes, budget.maxSeconds)
+
+        search = self.inflight.get(key)
+        if search is not None:
+            self.metrics.coalesced += 1
+        else:
+            self.metrics.solves += 1
+            search = asyncio.ensure_future(self.runSearch(scenario, strategy, seed, budget))
+            self.inflight[key] = search
+            self.waiters[key] = 0
+
+            def removeSearch(done: asyncio.Future) -> None:
+                if self.inflight.get(key) is done:
+                    del self.inflight[key]
+                    del self.waiters[key]
+
+            search.add_done_callback(removeSearch)
+
+        self.waiters[key] += 1
+        try:
+            # The shared search is shielded, so a request that goes away does not cancel it for the others
+            return await asyncio.shield(search)
+        finally:
+            if self.inflight.get(key) is search:
+                self.waiters[key] -= 1
+                if self.waiters[key] == 0:
+                    # Remove the search first, so that an identical request starts a new one instead of joining it
+                    del self.inflight[key]
+                    del self.waiters[key]
+                    search.cancel()
+
+    async def runSearch(self, scenario: tuple, strategy: str, seed: int, budget: SearchBudget) -> dict:
+        """
+        Runs a search on the process pool once a worker is free
+
+        INPUTS:
+            scenario: tuple -> (numC, numM, boatCapacity, numCrossings) tuple
+            strategy: str -> Search strategy of solveSafeCrossing
+            seed: int -> Seed for the random strategy
+            budget: SearchBudget -> Limits of the search
+        OUTPUTS:
+            DICTIONARY OF THE RESULT
+        """
+        await self.freeWorkers.acquire()
+        loop = asyncio.get_running_loop()
+        try:
+            workerFuture = self.executor.submit(solveSearchTask, scenario, strategy, seed, budget)
+        except BaseException:
+            self.freeWorkers.release()
+            raise
+        # The worker is free again only when the search returns, not when it is abandoned
+        workerFuture.add_done_callback(lambda done: loop.call_soon_threadsafe(self.freeWorkers.release))
+
+        # The search limits itself with the budget, the timeout only guards against a stuck worker
+        return await asyncio.wait_for(asyncio.wrap_future(workerFuture), budget.maxSeconds + 5.0)
+
+    async def handleRequest(self, line: bytes) -> dict:
+        """
+        Answers one request line
+
+        INPUTS:
+            line: bytes -> JSON line of the request
+        OUTPUTS:
+            DICTIONARY OF THE RESPONSE
+        """
+        startTime = time.perf_counter()
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("a request must be a JSON object")
+        except ValueError as error:
+            self.metrics.errors += 1
+            return {"status": "error", "error": "invalid request: %s" % error}
+
+        if request.get("op") == "metrics":
+            return self.metrics.toDict(len(self.inflight))
+
+        try:
+            response = await self.solve(request)
+        except asyncio.TimeoutError:
+            self.metrics.errors += 1
+            response = {"status": "error", "error": "timed out"}
+        except (ValueError, KeyError, TypeError) as error:
+            self.metrics.errors += 1
+            response = {"status": "error", "error": "invalid request: %s" % error}
+        else:
+            self.metrics.requests += 1
+            self.metrics.latencies.append(time.perf_counter() - startTime)
+
+        if "id" in request:
+            response = dict(response, id=request["id"])
+        return response
+
+    async def handleClient(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Serves the requests of one connection. Requests of a connection are answered concurrently,
+        in the order they complete, hence clients should match responses by their "id". Once the
+        connection is lost, the remaining requests of the connection are cancelled.
+
+        INPUTS:
+            reader: asyncio.StreamReader -> Stream of the requests
+            writer: asyncio.StreamWriter -> Stream of the responses
+        OUTPUTS:
+            NONE
+        """
+        pending = set()
+
+        async def respond(line: bytes) -> None:
+            response = await self.handleRequest(line)
+            try:
+                writer.write(json.dumps(response).encode() + b"\n")
+                await writer.drain()
+            except ConnectionError:
+                # The client is gone, the other requests of the connection are abandoned
+                for task in pending:
+                    task.cancel()
+
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                task = asyncio.create_task(respond(line))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        except ConnectionError:
+            pass
+        finally:
+            # Requests of a closed connection no longer wait for their searches
+            for task in pending:
+                task.cancel()
+            writer.close()
+
+
+def solveSearchTask(scenario: tuple, strategy: str, seed: int, budget: SearchBudget) -> dict:
+    """
+    Solves a scenario in a worker process of the service.
+
+    INPUTS:
+        scenario: tuple -> (numC, numM, boatCapacity, numCrossings) tuple
+        strategy: str -> Search strategy of solveSafeCrossing
+        seed: int -> Seed for the random strategy
+        budget: SearchBudget -> Limits of the search
+    OUTPUTS:
+        DICTIONARY OF THE RESULT
+    """
+    return solveScenario(*scenario, strategy=strategy, seed=seed, budget=budget).toDict()
+
+
+async def serve(host: str = "127.0.0.1", port: int = 8765, unixPath: str = None, workers: int = None,
+                maxSeconds: float = 10.0, maxNodes: int = None) -> None:
+    """
+    Runs the service until it is cancelled.
+
+    INPUTS:
+        host: str = "127.0.0.1" (default) -> Address to listen on for TCP
+        port: int = 8765 (default) -> Port to listen on for TCP
+        unixPath: str = None (default) -> Path of the Unix socket, TCP is used if None
+        workers: int = None (default) -> Number of worker processes, the number of CPUs if None
+        maxSeconds: float = 10.0 (default) -> Upper limit of the time budget of a request
+        maxNodes: int = None (default) -> Upper limit of the node budget of a request
+    OUTPUTS:
+        NONE
+    """
+    service = SolverService(workers, maxSeconds, maxNodes)
+    try:
+        if unixPath is not None:
+            server = await asyncio.start_unix_server(service.handleClient, path=unixPath)
+        else:
+            server = await asyncio.start_server(service.handleClient, host, port)
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.close()
+
+
+def main(arguments: list = None) -> int:
+    """
+    Entry point of the service.
+
+    INPUTS:
+        arguments: list = None (default) -> Command line arguments, sys.argv if None
+    OUTPUTS:
+        EXIT CODE OF THE PROCESS
+    """
+    parser = argparse.ArgumentParser(description="Serve missionaries and cannibals solutions over a socket.")
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on")
+    parser.add_argument("--port", type=int, default=8765, help="port to listen on")
+    parser.add_argument("--unix", metavar="PATH", help="listen on a Unix socket instead of TCP")
+    parser.add_argument("--workers", type=int, default=None, help="number of worker processes")
+    parser.add_argument("--max-seconds", type=float, default=10.0, help="upper limit of the time budget of a request")
+    parser.add_argument("--max-nodes", type=int, default=None, help="upper limit of the node budget of a request")
+    options = parser.parse_args(arguments)
+
+    try:
+        asyncio.run(serve(options.host, options.port, options.unix, options.workers, options.max_seconds,
+                          options.max_nodes))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
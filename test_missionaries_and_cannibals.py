@@ -0,0 +1,256 @@
+"""
+Tests of the solvers in missionaries_and_cannibals.py on small problems.
+"""
+
+import io
+import itertools
+import json
+
+import pytest
+
+from missionaries_and_cannibals import (INFEASIBLE, SOLVED, STRATEGIES, Path, RiverProblem, SearchResult,
+                                        SolutionCache, State, estimateEqualGroupCrossings,
+                                        findBidirectionalCrossing, findCrossingIDAStar, findExactCrossing,
+                                        getCrossingTable, getMinimumCrossings, isCrossingFeasible,
+                                        isCrossingPossible, iterSafeCrossings, readScenarios, runBatch,
+                                        solveSafeCrossing)
+
+# (numC, numM, boatCapacity) instances small enough to enumerate every plan
+SMALL_PROBLEMS = [(numC, numM, boatCapacity) for numC in range(0, 4) for numM in range(0, 4)
+                  for boatCapacity in (2, 3) if numC + numM > 0]
+
+MAX_CROSSINGS = 13
+
+
+def getPlanLengths(numC: int, numM: int, boatCapacity: int, maxCrossings: int) -> set:
+    initialState = State(numC, numM, "west", 0, 0)
+    goalState = State(0, 0, "east", numC, numM)
+    lengths = set()
+    for path in iterSafeCrossings(initialState, goalState, boatCapacity, maxCrossings):
+        assert len(set(path.states)) == len(path.states)
+        lengths.add(path.getLength() - 1)
+    return lengths
+
+
+@pytest.mark.parametrize("numC, numM, boatCapacity", SMALL_PROBLEMS)
+def test_verdicts_match_plan_enumeration(numC, numM, boatCapacity):
+    initialState = State(numC, numM, "west", 0, 0)
+    goalState = State(0, 0, "east", numC, numM)
+    planLengths = getPlanLengths(numC, numM, boatCapacity, MAX_CROSSINGS)
+
+    for numCrossings in range(1, MAX_CROSSINGS + 1):
+        expected = SOLVED if numCrossings in planLengths else INFEASIBLE
+        for strategy in STRATEGIES:
+            for seed in range(3) if strategy == "random" else [None]:
+                result = solveSafeCrossing(initialState, goalState, boatCapacity, numCrossings, strategy, seed)
+                assert result.status == expected, (strategy, seed, numCrossings)
+                if result.status == SOLVED:
+                    assert result.path.getLength() == numCrossings + 1
+                    assert result.path.getTerminalState() == goalState
+                    assert len(set(result.path.states)) == len(result.path.states)
+
+
+@pytest.mark.parametrize("numC, numM, boatCapacity", SMALL_PROBLEMS)
+def test_revisiting_verdicts_match_layered_search(numC, numM, boatCapacity):
+    initialState = State(numC, numM, "west", 0, 0)
+    goalState = State(0, 0, "east", numC, numM)
+    planLengths = getPlanLengths(numC, numM, boatCapacity, MAX_CROSSINGS)
+
+    for numCrossings in range(1, MAX_CROSSINGS + 1):
+        plan = findExactCrossing(initialState, goalState, boatCapacity, numCrossings)
+        expected = SOLVED if plan.getLength() != 0 else INFEASIBLE
+        # Every plan without revisits is a plan with revisits too
+        if numCrossings in planLengths:
+            assert expected == SOLVED, numCrossings
+        for strategy in STRATEGIES:
+            result = solveSafeCrossing(initialState, goalState, boatCapacity, numCrossings, strategy, seed=0,
+                                       allowRevisits=True)
+            assert result.status == expected, (strategy, numCrossings)
+            if result.status == SOLVED:
+                assert goalState not in result.path.states[:-1]
+
+        if plan.getLength() != 0:
+            assert plan.getLength() == numCrossings + 1
+            assert goalState not in plan.states[:-1]
+            for state, nextState in zip(plan.states, plan.states[1:]):
+                assert nextState in state.generateExpansions(boatCapacity)
+
+
+def test_plan_through_repeated_depth_is_found():
+    # The first path to reach a state at some depth must not hide the other paths through it
+    initialState = State(0, 3, "west", 0, 0)
+    goalState = State(0, 0, "east", 0, 3)
+    for strategy in STRATEGIES:
+        result = solveSafeCrossing(initialState, goalState, 3, 3, strategy, seed=0)
+        assert result.status == SOLVED, strategy
+
+
+def test_default_plans_never_revisit_states():
+    # The only 13 crossing plans of the classic problem carry someone back and forth
+    initialState = State(3, 3, "west", 0, 0)
+    goalState = State(0, 0, "east", 3, 3)
+    for strategy in STRATEGIES:
+        assert solveSafeCrossing(initialState, goalState, 2, 13, strategy, seed=0).status == INFEASIBLE, strategy
+        result = solveSafeCrossing(initialState, goalState, 2, 13, strategy, seed=0, allowRevisits=True)
+        assert result.status == SOLVED, strategy
+
+    result = solveSafeCrossing(initialState, goalState, 2, 11, "random", seed=0)
+    assert result.status == SOLVED
+    assert len(set(result.path.states)) == len(result.path.states)
+
+
+@pytest.mark.parametrize("boatCapacity", range(1, 6))
+def test_expansions_are_safe_actions(boatCapacity):
+    for cannibalsOnWest in range(4):
+        for missionariesOnWest in range(4):
+            for boatSide in ("west", "east"):
+                state = State(cannibalsOnWest, missionariesOnWest, boatSide,
+                              3 - cannibalsOnWest, 3 - missionariesOnWest)
+                for expansion in state.generateExpansions(boatCapacity):
+                    assert state.isActionSafe(expansion), (state, expansion)
+
+    # Two cannibals and one missionary on the boat
+    assert not State(3, 3, "west", 0, 0).isActionSafe(State(1, 2, "east", 2, 1))
+    assert State(3, 3, "west", 0, 0).isActionSafe(State(1, 3, "east", 2, 0))
+
+
+def test_bidirectional_rejects_unsafe_endpoints():
+    initialState = State(2, 1, "west", 0, 0)
+    goalState = State(0, 0, "east", 2, 1)
+    assert findBidirectionalCrossing(initialState, goalState, 2).getLength() == 0
+
+
+@pytest.mark.parametrize("boatCapacity", range(2, 9))
+def test_equal_group_bound_is_admissible(boatCapacity):
+    for numPairs in range(1, 21):
+        table = getCrossingTable(numPairs, numPairs, boatCapacity)
+        for boatSide in ("west", "east"):
+            for cannibalsOnWest in range(numPairs + 1):
+                for missionariesOnWest in range(numPairs + 1):
+                    state = State(cannibalsOnWest, missionariesOnWest, boatSide,
+                                  numPairs - cannibalsOnWest, numPairs - missionariesOnWest)
+                    distance = table.getDistance(state)
+                    if distance != -1:
+                        assert estimateEqualGroupCrossings(state, boatCapacity) <= distance, state
+
+
+@pytest.mark.parametrize("boatCapacity", range(1, 9))
+def test_feasibility_oracle_matches_crossing_table(boatCapacity):
+    for numC in range(0, 30):
+        for numM in range(0, 30):
+            initialState = State(numC, numM, "west", 0, 0)
+            goalState = State(0, 0, "east", numC, numM)
+            distance = getCrossingTable(numC, numM, boatCapacity).getDistance(initialState)
+            assert isCrossingFeasible(numC, numM, boatCapacity) == (distance != -1), (numC, numM)
+            assert getMinimumCrossings(numC, numM, boatCapacity) == distance, (numC, numM)
+            # Infeasible problems and wrong parities are rejected, the shortest plans are not
+            for numCrossings in range(0, max(distance, 0) + 3):
+                isPossible = isCrossingPossible(initialState, goalState, boatCapacity, numCrossings)
+                if distance == -1 or numCrossings % 2 == 0:
+                    assert not isPossible, (numC, numM, numCrossings)
+                elif numCrossings == distance:
+                    assert isPossible, (numC, numM, numCrossings)
+
+
+@pytest.mark.parametrize("numC, numM, boatCapacity", [(3, 3, 2), (5, 5, 3), (20, 20, 4), (50, 50, 5), (40, 60, 5),
+                                                      (100, 100, 8)])
+def test_ida_star_finds_shortest_plans(numC, numM, boatCapacity):
+    initialState = State(numC, numM, "west", 0, 0)
+    goalState = State(0, 0, "east", numC, numM)
+    minimumCrossings = getCrossingTable(numC, numM, boatCapacity).getDistance(initialState)
+    path = findCrossingIDAStar(initialState, goalState, boatCapacity, minimumCrossings)
+    assert path.getLength() == minimumCrossings + 1
+    assert findCrossingIDAStar(initialState, goalState, boatCapacity, minimumCrossings - 1).getLength() == 0
+
+
+@pytest.mark.parametrize("boatCapacity", range(1, 7))
+def test_classic_river_problem_matches_crossing_table(boatCapacity):
+    for numC in range(0, 12):
+        for numM in range(0, 12):
+            if numC + numM == 0:
+                continue
+            problem = RiverProblem.classic(numC, numM, boatCapacity)
+            plan = problem.solve()
+            initialState = State(numC, numM, "west", 0, 0)
+            distance = getCrossingTable(numC, numM, boatCapacity).getDistance(initialState)
+            if plan is None:
+                assert distance == -1, (numC, numM)
+                continue
+            assert len(plan) - 1 == distance, (numC, numM)
+            path = problem.toPath(plan)
+            assert path.states[0] == initialState
+            assert path.getTerminalState() == State(0, 0, "east", numC, numM)
+            for state, nextState in zip(path.states, path.states[1:]):
+                assert nextState in state.generateExpansions(boatCapacity)
+
+
+def test_river_problem_with_three_groups_and_boats():
+    problem = RiverProblem((10, 15, 12), (3, 5, 2), ((0, 1), (0, 2)))
+    plan = problem.solve()
+    assert len(plan) - 1 == 17
+    assert plan[-1] % problem.countsSpace == 0
+    for key, nextKey in zip(plan, plan[1:]):
+        assert nextKey in problem.generateExpansions(key)
+    assert problem.solve(maxCrossings=16) is None
+
+
+@pytest.mark.parametrize("numC, numM, boatCapacity", [(3, 3, 2), (5, 5, 3), (2, 7, 2), (40, 60, 5)])
+def test_solution_cache_decodes_encoded_paths(numC, numM, boatCapacity):
+    path = getCrossingTable(numC, numM, boatCapacity).getPath(State(numC, numM, "west", 0, 0))
+    data = SolutionCache.encodePath(path)
+    assert chr(data[1]) == "H"
+    assert SolutionCache.decodePath(data, numC, numM).getContent() == path.getContent()
+    assert SolutionCache.decodePath(SolutionCache.encodePath(Path()), numC, numM).getContent() == []
+
+
+def test_solution_cache_decodes_paths_of_large_problems():
+    # Counts of 65536 or more do not fit in 16 bits
+    numC = numM = 70000
+    path = Path([State(numC, numM, "west", 0, 0), State(numC - 2, numM - 2, "east", 2, 2),
+                 State(numC - 1, numM - 1, "west", 1, 1)])
+    data = SolutionCache.encodePath(path)
+    assert chr(data[1]) == "I"
+    assert SolutionCache.decodePath(data, numC, numM).getContent() == path.getContent()
+
+
+def test_solution_cache_evicts_least_recently_used(tmp_path, monkeypatch):
+    clock = itertools.count()
+    monkeypatch.setattr("missionaries_and_cannibals.time.time", lambda: next(clock))
+    cache = SolutionCache(str(tmp_path / "cache.db"), maxEntries=32)
+    for numCrossings in range(100):
+        cache.put((0, 0, 2, numCrossings), SearchResult(None, INFEASIBLE, Path(), 0, 0.0))
+        # The first scenario is used after every insert, hence it is never evicted
+        assert cache.get((0, 0, 2, 0)) is not None
+        assert cache.entryCount <= cache.maxEntries
+    assert cache.getConnection().execute("SELECT COUNT(*) FROM solutions").fetchone()[0] == cache.entryCount
+    assert cache.get((0, 0, 2, 99)).status == INFEASIBLE
+    assert cache.get((0, 0, 2, 1)) is None
+    cache.close()
+
+
+def test_batch_writes_results_and_references_duplicates():
+    scenarios = [
+        {"numC": 3, "numM": 3, "boatCapacity": 2, "numCrossings": 11},
+        {"numC": 3, "numM": 3, "boatCapacity": 2, "numCrossings": 13},
+        {"numC": 3, "numM": 3, "boatCapacity": 2, "numCrossings": 11},
+        {"numC": 3.9, "numM": 3, "boatCapacity": 2, "numCrossings": 11},
+    ]
+    inputStream = io.StringIO("".join(json.dumps(scenario) + "\n" for scenario in scenarios) + "\nnot json\n")
+    outputStream = io.StringIO()
+
+    assert runBatch(inputStream, outputStream, strategy="bfs") == 2
+    lines = [json.loads(line) for line in outputStream.getvalue().splitlines()]
+
+    assert [line["line"] for line in lines] == [1, 2, 3, 4, 6]
+    assert lines[0]["status"] == SOLVED and lines[0]["crossings"] == 11 and len(lines[0]["plan"]) == 12
+    assert lines[1]["status"] == INFEASIBLE and lines[1]["plan"] is None
+    assert lines[2] == {"line": 3, "duplicateOf": 1}
+    assert lines[3]["status"] == "error" and "numC" in lines[3]["error"]
+    assert lines[4]["status"] == "error"
+
+
+def test_csv_scenarios_require_integers():
+    stream = io.StringIO("numC,numM,boatCapacity,numCrossings\n3,3,2,11\n3.9,3,2,11\n-1,3,2,11\n")
+    scenarios = list(readScenarios(stream, "csv"))
+    assert scenarios[0] == (2, (3, 3, 2, 11))
+    assert [lineNumber for lineNumber, scenario in scenarios[1:] if isinstance(scenario, str)] == [3, 4]